@@ -18,6 +18,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string
 from openpyxl.worksheet.worksheet import Worksheet
 from functools import lru_cache
 import unicodedata as _u
@@ -41,7 +42,7 @@ def _stage_copy_for_read(src: Path) -> Tuple[Path, Path]:
     """Copy workbook to temp so it can stay open in Excel while we read."""
     tmpdir = Path(tempfile.mkdtemp(prefix="mlb_weekly_"))
     dst = tmpdir / src.name
-    shutil.copy2(src, dst)
+    shutil.copyfile(src, dst)
     return dst, tmpdir
 
 # ------------------------ header normalization --------------------
@@ -61,27 +62,29 @@ def _norm_header_label(s: str) -> str:
     return _HEADER_ALIASES.get(key, t)
 
 def _dedup_headers(names) -> List[str]:
-    seen, out = {}, []
-    for i, raw in enumerate(list(names)):
+    seen: Dict[str, int] = {}
+    out: List[str] = []
+    for i, raw in enumerate(names):
         s = "" if raw is None else str(raw).strip()
-        if s == "" or s.lower().startswith("unnamed"):
+        if not s or s.lower().startswith("unnamed"):
             s = f"col_{i+1}"
-        key = s
-        if key in seen:
-            seen[key] += 1
-            key = f"{key}__{seen[key]}"
-        else:
-            seen[key] = 0
-        out.append(key)
+        n = seen.get(s, -1) + 1
+        seen[s] = n
+        out.append(f"{s}__{n}" if n else s)
     return out
 
 def _excel_col_to_idx(label: str) -> int:
-    s = re.sub(r"[^A-Za-z]", "", str(label)).upper()
+    s = str(label).strip()
+    if not (s.isascii() and s.isalpha()):
+        s = re.sub(r"[^A-Za-z]", "", s)
     if not s: return 0
-    n = 0
-    for ch in s:
-        n = n * 26 + (ord(ch) - ord("A") + 1)
-    return n - 1
+    try:
+        return column_index_from_string(s.upper()) - 1
+    except ValueError:  # past ZZZ: plain base-26, left for the caller to bound
+        n = 0
+        for ch in s.upper():
+            n = n * 26 + (ord(ch) - 64)
+        return n - 1
 
 def _slice_from_letters(min_letter: Optional[str], max_letter: Optional[str], ws: Worksheet) -> Tuple[int,int]:
     if not min_letter and not max_letter:
@@ -150,10 +153,10 @@ def read_literal_table_ws(ws: Worksheet,
         blanks_in_a_row = 0
         out_rows.append(vals)
 
-    df = pd.DataFrame(out_rows, columns=headers)
-    df = df.replace("", np.nan).dropna(how="all").fillna("")
-    df = df.loc[:, ~(df.astype(str).eq("").all())]
-    return df
+    # blank rows were never appended, so one mask drops the all-empty columns
+    arr = np.array(out_rows, dtype=object).reshape(len(out_rows), len(headers))
+    col_keep = (arr != "").any(axis=0)
+    return pd.DataFrame(arr[:, col_keep], columns=[h for h, k in zip(headers, col_keep) if k])
 
 def _read_proj_block(wb, sheet: str, header_row: int, data_start_row: int) -> pd.DataFrame:
     if sheet not in wb.sheetnames:
@@ -621,7 +624,7 @@ def main() -> None:
     # Stage copy so Excel can remain open; then open ONCE read-only
     staged_xlsm, temp_dir = _stage_copy_for_read(xlsm_path)
     try:
-        cfg = json.loads(config_path.read_text(encoding="utf-8-sig"))
+        cfg = json.loads(config_path.read_bytes())
         wb = load_workbook(staged_xlsm, data_only=True, read_only=True, keep_links=False)
 
         if not args.only_xwalk:
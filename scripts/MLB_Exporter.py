@@ -17,15 +17,60 @@ Usage:
 
 from __future__ import annotations
 
-import argparse, json, re, sys, shutil, tempfile, datetime, time
+import argparse, csv, gzip, io, json, os, re, sys, shutil, tempfile, datetime, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 import numpy as np
 from openpyxl import load_workbook
+from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.utils.cell import column_index_from_string
 from openpyxl.worksheet.worksheet import Worksheet
 
+from export_common import combine_masks, filter_re
+
+# ---------- fast JSON ----------
+# Pretty (indent=2) by default so the committed public/data diffs stay readable;
+# --compact-json switches to minimal separators for deploys that don't track the files.
+_JSON_COMPACT = False
+
+def _set_json_compact(flag: bool) -> None:
+    global _JSON_COMPACT
+    _JSON_COMPACT = bool(flag)
+
+try:
+    import orjson
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=0 if _JSON_COMPACT else orjson.OPT_INDENT_2)
+    def _dump_file(obj, path: Path) -> None:
+        path.write_bytes(_dumps(obj))
+except Exception:  # pragma: no cover
+    def _json_kw() -> Dict[str, Any]:
+        return {"separators": (",", ":")} if _JSON_COMPACT else {"indent": 2}
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, **_json_kw()).encode("utf-8")
+    def _dump_file(obj, path: Path) -> None:
+        # stdlib: stream into a 1 MiB buffer rather than building the whole indented string
+        with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as fh:
+            json.dump(obj, fh, ensure_ascii=False, **_json_kw())
+
+# optional: xlsx2csv for --fast-csv sheet dumps
+try:
+    from xlsx2csv import Xlsx2csv
+except Exception:  # pragma: no cover
+    Xlsx2csv = None
+
+# optional: python-calamine for tasks/gameboard with "engine": "calamine"
+try:
+    from python_calamine import CalamineWorkbook
+except Exception:  # pragma: no cover
+    CalamineWorkbook = None
+
 
 # ------------------------- ROOT / DEFAULT PATHS -------------------------
 
@@ -45,6 +90,18 @@ def ensure_parent(path: Path) -> None:
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
+@contextmanager
+def _atomic_target(path: Path):
+    """Yield a sibling temp path and swap it into place only once the write finished."""
+    ensure_parent(path)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        yield tmp
+        os.replace(tmp, path)   # the site never sees a half-written file
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
 def dedup(names: Iterable) -> List[str]:
     seen: Dict[str, int] = {}
     out: List[str] = []
@@ -61,15 +118,30 @@ def dedup(names: Iterable) -> List[str]:
         out.append(key)
     return out
 
-def to_json_records(df: pd.DataFrame) -> str:
-    df2 = df.astype(object).where(pd.notna(df), "")
-    return df2.to_json(orient="records", force_ascii=False, indent=2)
-
-def _stage_copy_for_read(src: Path) -> tuple[Path, Path]:
-    """Copy workbook to temp so Excel can stay open while we read."""
+def to_json_records(df: pd.DataFrame) -> bytes:
+    if not df.columns.is_unique:
+        # same refusal as pandas' to_json; row dicts would keep only the last duplicate
+        raise ValueError("DataFrame columns must be unique for orient='records'.")
+    # one object array instead of astype(object) + where + to_dict copies
+    arr = df.to_numpy(dtype=object)
+    na = pd.isna(arr)
+    if na.any():
+        arr = arr.copy()
+        arr[na] = ""
+    cols = df.columns.tolist()
+    return _dumps([dict(zip(cols, row)) for row in arr.tolist()])
+
+# a workbook path, or an in-memory snapshot of one (anything load_workbook opens)
+XlsxSource = Union[Path, io.BytesIO]
+
+def _stage_copy_for_read(src: Path, data: Optional[bytes] = None) -> tuple[Path, Path]:
+    """Copy workbook to temp so Excel can stay open while we read (`data`: bytes already read from src)."""
     tmpdir = Path(tempfile.mkdtemp(prefix="mlb_export_"))
     dst = tmpdir / src.name
-    shutil.copy2(src, dst)
+    if data is None:
+        shutil.copyfile(src, dst)
+    else:
+        dst.write_bytes(data)
     return dst, tmpdir
 
 
@@ -80,8 +152,9 @@ _META_DIRS: set[Path] = set()
 def _mark_meta_dir(path_like: Optional[Path]) -> None:
     if not path_like:
         return
-    p = Path(path_like).resolve()
-    _META_DIRS.add(p.parent if p.is_file() else p)
+    # every caller hands over a file it just wrote under the already-resolved project
+    # root, so a lexical abspath does; resolve() would lstat every path component
+    _META_DIRS.add(Path(os.path.abspath(path_like)).parent)
 
 def _write_meta_files(xlsm_path: Path) -> None:
     """Write meta.json into every directory in _META_DIRS."""
@@ -104,10 +177,12 @@ def _write_meta_files(xlsm_path: Path) -> None:
         "source_mtime_iso": mtime_iso,
     }
 
+    # same payload everywhere: serialise once, then one bytes write per dir
+    payload = json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8")
     for d in sorted(_META_DIRS):
         try:
             ensure_parent(d / "meta.json")
-            (d / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+            (d / "meta.json").write_bytes(payload)
             print(f"🕒 meta  → {d / 'meta.json'}")
         except Exception as e:
             print(f"⚠️  meta write failed for {d}: {e}")
@@ -115,19 +190,31 @@ def _write_meta_files(xlsm_path: Path) -> None:
 
 # --------------------- openpyxl “display text” formatting --------------------
 
-_PERCENT_RE = re.compile(r"%")
+_PERCENT_RE  = re.compile(r"%")
+_DECIMALS_RE = re.compile(r"0\.([0]+)")
+
+@lru_cache(maxsize=256)
+def _fmt_meta(fmt: str) -> tuple[int, bool]:
+    """(decimals, is_percent) for a number format — a sheet only has a handful of distinct ones."""
+    m = _DECIMALS_RE.search(fmt)
+    return (len(m.group(1)) if m else 0), bool(_PERCENT_RE.search(fmt))
 
 def _decimals_from_format(fmt: str) -> int:
     if not isinstance(fmt, str):
         return 0
-    m = re.search(r"0\.([0]+)", fmt)
-    return len(m.group(1)) if m else 0
+    return _fmt_meta(fmt)[0]
 
 def _format_cell(cell) -> str:
     v = cell.value
     if v is None:
         return ""
-    fmt = cell.number_format or ""
+
+    # exact-type checks first: plain str/float/int are nearly every cell
+    t = type(v)
+    if t is str:
+        return v.strip()
+    if t is float or t is int:
+        return _format_number(float(v), cell.number_format or "")
 
     # Dates/times
     if isinstance(v, (datetime.date, datetime.datetime, datetime.time)):
@@ -135,20 +222,21 @@ def _format_cell(cell) -> str:
 
     # Numbers
     if isinstance(v, (int, float, np.floating)):
-        x = float(v)
-        if _PERCENT_RE.search(fmt):
-            dec = _decimals_from_format(fmt)
-            n = x * 100.0 if abs(x) <= 1.01 else x
-            if float(n).is_integer():
-                return f"{int(round(n))}%"
-            return f"{n:.{dec}f}%"
-        if float(x).is_integer():
-            return str(int(round(x)))
-        dec = _decimals_from_format(fmt) or 1
-        return f"{x:.{dec}f}"
+        return _format_number(float(v), cell.number_format or "")
 
     return str(v).strip()
 
+def _format_number(x: float, number_format: str) -> str:
+    dec, is_pct = _fmt_meta(number_format)
+    if is_pct:
+        n = x * 100.0 if abs(x) <= 1.01 else x
+        if n.is_integer():
+            return f"{int(round(n))}%"
+        return f"{n:.{dec}f}%"
+    if x.is_integer():
+        return str(int(round(x)))
+    return f"{x:.{dec or 1}f}"
+
 
 # ------------------------------ header normalization --------------------
 
@@ -174,55 +262,77 @@ def _resolve_col(df: pd.DataFrame, name: str) -> Optional[str]:
     low_map = {c.lower(): c for c in df.columns}
     return low_map.get((name or "").lower())
 
-def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
+def _op_regex(vals: List[str], val: str, cs: bool) -> Iterable[bool]:
+    match = filter_re(val, 0 if cs else re.IGNORECASE).match
+    return (match(x) is not None for x in vals)
+
+def _op_contains(vals: List[str], val: str, cs: bool) -> Iterable[bool]:
+    # str.contains semantics: the value is a regex
+    search = filter_re(val, 0).search
+    return (search(x) is not None for x in vals)
+
+# op → (column values as str, value, case_sensitive) -> per-row bools.
+# Plain comprehensions over a list beat the .str accessor at these table sizes.
+_FILTER_OPS: Dict[str, Callable[[List[str], str, bool], Iterable[bool]]] = {
+    "equals":       lambda vals, v, cs: (x == v for x in vals),
+    "not_equals":   lambda vals, v, cs: (x != v for x in vals),
+    "contains":     _op_contains,
+    "not_contains": lambda vals, v, cs: (not m for m in _op_contains(vals, v, cs)),
+    "startswith":   lambda vals, v, cs: (x.startswith(v) for x in vals),
+    "endswith":     lambda vals, v, cs: (x.endswith(v) for x in vals),
+    "regex":        _op_regex,
+}
+
+def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any],
+                       _cache: Optional[Dict[tuple, List[str]]] = None) -> pd.Series:
     col_name = _resolve_col(df, f.get("column", ""))
     if not col_name:
         return pd.Series([True] * len(df), index=df.index)
 
     op = (f.get("op") or "contains").lower()
     cs = bool(f.get("case_sensitive", False))
-    s = df[col_name].astype(str)
-    if not cs:
-        s = s.str.lower()
-
-    if op == "nonempty":       return s.str.strip().ne("")
-    val = str(f.get("value", "")).strip()
-    if not cs:                 val = val.lower()
-
-    if   op == "equals":       res = s.eq(val)
-    elif op == "not_equals":   res = s.ne(val)
-    elif op == "contains":     res = s.str.contains(val, na=False)
-    elif op == "not_contains": res = ~s.str.contains(val, na=False)
-    elif op == "startswith":   res = s.str.startswith(val, na=False)
-    elif op == "endswith":     res = s.str.endswith(val, na=False)
-    elif op == "regex":
-        try:
-            pat = re.compile(val, 0 if cs else re.IGNORECASE)
-            res = s.str.match(pat).fillna(False)
-        except Exception:
-            res = pd.Series([True] * len(df), index=df.index)
+    # several filters on one column share its str / lower-cased values
+    key = (col_name, cs)
+    vals = _cache.get(key) if _cache is not None else None
+    if vals is None:
+        vals = [str(x) for x in df[col_name].tolist()]
+        if not cs:
+            vals = [x.lower() for x in vals]
+        if _cache is not None:
+            _cache[key] = vals
+
+    if op == "nonempty":
+        bools = (x.strip() != "" for x in vals)
     else:
-        res = pd.Series([True] * len(df), index=df.index)
-
-    return res.fillna(False)
+        fn = _FILTER_OPS.get(op)
+        if fn is None:
+            return pd.Series([True] * len(df), index=df.index)
+        val = str(f.get("value", "")).strip()
+        if not cs: val = val.lower()
+        try:
+            bools = fn(vals, val, cs)
+        except re.error:
+            if op != "regex": raise   # a bad regex only disables the "regex" op
+            return pd.Series([True] * len(df), index=df.index)
+    return pd.Series(np.fromiter(bools, dtype=bool, count=len(vals)), index=df.index)
 
 def _apply_filters(df: pd.DataFrame, filters: Union[List, Dict, None]) -> pd.DataFrame:
+    col_cache: Dict[tuple, List[str]] = {}
+
     def eval_filter(f) -> pd.Series:
         if isinstance(f, dict) and ("any_of" in f or "all_of" in f):
             if "any_of" in f:
-                parts = [eval_filter(x) for x in (f.get("any_of") or [])]
-                return pd.concat(parts, axis=1).any(axis=1) if parts else pd.Series([True]*len(df), index=df.index)
+                return combine_masks([eval_filter(x) for x in (f.get("any_of") or [])], df.index, "any")
             if "all_of" in f:
-                parts = [eval_filter(x) for x in (f.get("all_of") or [])]
-                return pd.concat(parts, axis=1).all(axis=1) if parts else pd.Series([True]*len(df), index=df.index)
-        return _apply_leaf_filter(df, f)
+                return combine_masks([eval_filter(x) for x in (f.get("all_of") or [])], df.index, "all")
+        return _apply_leaf_filter(df, f, col_cache)
 
     if not filters: return df
     if isinstance(filters, dict) and ("any_of" in filters or "all_of" in filters):
         return df[eval_filter(filters)]
     if isinstance(filters, list):
         masks = [eval_filter(f) for f in filters]
-        return df[pd.concat(masks, axis=1).all(axis=1)] if masks else df
+        return df[combine_masks(masks, df.index, "all")] if masks else df
     return df
 
 
@@ -237,30 +347,141 @@ def reorder_columns_if_all_present(df: pd.DataFrame, order: List[str] | None) ->
     if not order: return df
     return df[order] if all(c in df.columns for c in order) else df
 
-def export_one(df: pd.DataFrame, out_csv: Optional[Path], out_json: Optional[Path]) -> None:
+def export_one(df: pd.DataFrame, out_csv: Optional[Path], out_json: Optional[Path],
+               out_feather: Optional[Path] = None) -> None:
     if out_csv:
-        ensure_parent(out_csv)
-        df.astype(object).where(pd.notna(df), "").to_csv(out_csv, index=False, encoding="utf-8-sig")
+        with _atomic_target(out_csv) as tmp:
+            df.to_csv(tmp, index=False, encoding="utf-8-sig", na_rep="", lineterminator="\n")
         print(f"✔️  CSV  → {out_csv}")
         _mark_meta_dir(out_csv)
     if out_json:
-        ensure_parent(out_json)
-        out_json.write_text(to_json_records(df), encoding="utf-8")
+        with _atomic_target(out_json) as tmp:
+            tmp.write_bytes(to_json_records(df))
         print(f"✔️  JSON → {out_json}")
         _mark_meta_dir(out_json)
-
-def run_task(xlsm_path: Path, project_root: Path, task: Dict[str, Any]) -> None:
+    if out_feather:
+        # Arrow IPC sibling for tooling that re-loads the tables (needs pyarrow)
+        try:
+            with _atomic_target(out_feather) as tmp:
+                df.reset_index(drop=True).to_feather(tmp, compression="zstd")
+        except Exception as e:
+            print(f"⚠️  Feather skipped for {out_feather.name}: {e}")
+        else:
+            print(f"✔️  FEATHER → {out_feather}")
+            _mark_meta_dir(out_feather)
+
+def _write_json_sections(out_path: Path, sections: Dict[str, Any]) -> None:
+    """Write {title: records, ...} one section at a time instead of one big buffer."""
+    with _atomic_target(out_path) as tmp, tmp.open("wb") as fh:
+        lead, colon, tail = (b"", b":", b"") if _JSON_COMPACT else (b"\n  ", b": ", b"\n")
+        fh.write(b"{")
+        for n, (key, val) in enumerate(sections.items()):
+            if n:
+                fh.write(b",")
+            fh.write(lead)
+            fh.write(_dumps(key))
+            fh.write(colon)
+            body = _dumps(val)
+            # _dumps indents from column 0; each section sits one level in. Raw
+            # newlines only occur between tokens (strings escape theirs).
+            fh.write(body if _JSON_COMPACT else body.replace(b"\n", b"\n  "))
+        fh.write(tail + b"}" if sections else b"}")
+
+def export_records_csv(columns: List[str], rows: List[List[str]], out_csv: Path) -> None:
+    """Same bytes as export_one's df.to_csv — pandas writes through csv.writer too."""
+    with _atomic_target(out_csv) as tmp, tmp.open("w", encoding="utf-8-sig", newline="") as fh:
+        w = csv.writer(fh, lineterminator="\n")
+        w.writerow(columns)
+        w.writerows(rows)
+    print(f"✔️  CSV  → {out_csv}")
+    _mark_meta_dir(out_csv)
+
+def _gzip_sidecar(path: Path) -> None:
+    """Write `<path>.gz` next to a finished output so the host can serve it precompressed."""
+    gz_path = path.with_name(path.name + ".gz")
+    with _atomic_target(gz_path) as tmp, path.open("rb") as src, tmp.open("wb") as raw:
+        # mtime=0 keeps the archive byte-stable when the JSON itself didn't change
+        with gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=6, mtime=0) as gz:
+            shutil.copyfileobj(src, gz, 1 << 20)
+    print(f"✔️  GZIP → {gz_path}")
+
+def export_records_json(records: List[Dict[str, Any]], out_json: Path) -> None:
+    with _atomic_target(out_json) as tmp:
+        _dump_file(records, tmp)
+    print(f"✔️  JSON → {out_json}")
+    _mark_meta_dir(out_json)
+
+def run_task(xlsm_path: XlsxSource, project_root: Path, task: Dict[str, Any],
+             csv_dir: Optional[Path] = None, wb: Optional[Any] = None) -> None:
+    """`wb` is an already-open read_only workbook of `xlsm_path` to share across tasks."""
     sheet = task.get("sheet")
     if not sheet:
         print("⚠️  SKIP: task missing 'sheet'"); return
 
-    df = read_literal_table(
-        xlsm_path=xlsm_path,
-        sheet=sheet,
-        header_row=task.get("header_row"),
-        data_start_row=task.get("data_start_row"),
-        limit_to_col=task.get("limit_to_col"),
-    )
+    out_rel = (task.get("out_rel") or "").lstrip(r"\/")
+    if not out_rel:
+        # nothing to write, so don't read the sheet either
+        print(f"⚠️  SKIP: task for '{sheet}' missing 'out_rel'"); return
+    # output paths hang off this one base for the whole task
+    base = project_root / "public" / Path(out_rel)
+    fmt = str(task.get("format", "json")).lower()
+    engine = str(task.get("engine", "openpyxl")).lower()
+    csv_file = (csv_dir / f"{sheet}.csv") if csv_dir else None
+    if csv_file is not None and not csv_file.exists():
+        csv_file = None
+
+    # tasks without filters never need a DataFrame
+    if csv_file is None and fmt in ("csv", "json", "both") and not task.get("filters"):
+        headers, rows = read_literal_records(
+            xlsm_path=xlsm_path,
+            sheet=sheet,
+            header_row=task.get("header_row"),
+            data_start_row=task.get("data_start_row"),
+            limit_to_col=task.get("limit_to_col"),
+            engine=engine,
+            wb=wb,
+        )
+        keep_cols_src: List[str] = task.get("keep_columns_sheet_order", [])
+        cols = [c for c in headers if c in keep_cols_src] if keep_cols_src else list(headers)
+        mapping = task.get("column_mapping") or {}
+        names = [mapping.get(c, c) for c in cols]
+        order = task.get("column_order")
+        if order and all(c in names for c in order):
+            cols = [cols[names.index(c)] for c in order]
+            names = list(order)
+        if fmt in ("csv", "both"):
+            export_records_csv(names, [list(map(rec.__getitem__, cols)) for rec in rows], base.with_suffix(".csv"))
+        if fmt in ("json", "both"):
+            if len(set(names)) != len(names):
+                # a mapping collapsed two columns onto one name; the row dicts would keep only the last
+                raise ValueError(f"{sheet}: columns must be unique for JSON records, got {names}")
+            if names == headers:
+                records = rows
+            else:
+                names = tuple(names)
+                records = [dict(zip(names, map(rec.__getitem__, cols))) for rec in rows]
+            export_records_json(records, base.with_suffix(".json"))
+            if task.get("gzip"):
+                _gzip_sidecar(base.with_suffix(".json"))
+        return
+
+    if csv_file is not None:
+        df = read_csv_table(
+            csv_path=csv_file,
+            header_row=task.get("header_row"),
+            data_start_row=task.get("data_start_row"),
+            limit_to_col=task.get("limit_to_col"),
+        )
+    else:
+        df = read_literal_table(
+            xlsm_path=xlsm_path,
+            sheet=sheet,
+            header_row=task.get("header_row"),
+            data_start_row=task.get("data_start_row"),
+            limit_to_col=task.get("limit_to_col"),
+            engine=engine,
+            wb=wb,
+        )
 
     keep_cols_src: List[str] = task.get("keep_columns_sheet_order", [])
     if keep_cols_src:
@@ -270,88 +491,357 @@ def run_task(xlsm_path: Path, project_root: Path, task: Dict[str, Any]) -> None:
     df = reorder_columns_if_all_present(df, task.get("column_order"))
     df = _apply_filters(df, task.get("filters"))
 
-    out_rel = (task.get("out_rel") or "").lstrip(r"\/")
-    if not out_rel:
-        print(f"⚠️  SKIP: task for '{sheet}' missing 'out_rel'"); return
+    csv_path     = base.with_suffix(".csv")     if fmt in ("csv", "both", "all")  else None
+    json_path    = base.with_suffix(".json")    if fmt in ("json", "both", "all") else None
+    feather_path = base.with_suffix(".feather") if fmt in ("feather", "all")      else None
+    export_one(df, csv_path, json_path, feather_path)
+    if json_path and task.get("gzip"):
+        _gzip_sidecar(json_path)
 
-    base = project_root / "public" / Path(out_rel)
+
+def _run_task_worker(xlsm_path: Path, project_root: Path, task: Dict[str, Any],
+                     csv_dir: Optional[Path] = None) -> tuple[List[Path], Optional[str]]:
+    """Process-pool entry: run one task and hand back the meta dirs it touched (and any error)."""
+    _META_DIRS.clear()
+    try:
+        run_task(xlsm_path, project_root, task, csv_dir)
+        err = None
+    except Exception as e:
+        err = str(e)
+    return sorted(_META_DIRS), err
+
+
+def _task_is_fresh(project_root: Path, task: Dict[str, Any], since: float) -> bool:
+    """True when every file the task writes exists and is newer than `since` (for --incremental)."""
+    out_rel = (task.get("out_rel") or "").lstrip(r"\/")
+    if not out_rel or not task.get("sheet"):
+        return False
     fmt = str(task.get("format", "json")).lower()
-    csv_path  = base.with_suffix(".csv")  if fmt in ("csv", "both")  else None
-    json_path = base.with_suffix(".json") if fmt in ("json", "both") else None
-    export_one(df, csv_path, json_path)
+    suffixes = {"csv": (".csv",), "json": (".json",), "both": (".csv", ".json"),
+                "feather": (".feather",), "all": (".csv", ".json", ".feather")}.get(fmt, (".json",))
+    if task.get("gzip") and ".json" in suffixes:
+        suffixes += (".json.gz",)
+    base = project_root / "public" / Path(out_rel)
+    try:
+        return all(base.with_suffix(sfx).stat().st_mtime > since for sfx in suffixes)
+    except OSError:
+        return False
+
+# flags that change what the task files contain; mtimes can't see a change in these,
+# so the last run's values are kept at the project root and a mismatch rebuilds everything
+_OUTPUT_FLAGS_FILE = ".mlb_export_flags.json"
+
+def _output_flags_changed(project_root: Path, flags: Dict[str, Any]) -> bool:
+    try:
+        return json.loads((project_root / _OUTPUT_FLAGS_FILE).read_bytes()) != flags
+    except (OSError, ValueError):
+        return True
+
+def _save_output_flags(project_root: Path, flags: Dict[str, Any]) -> None:
+    try:
+        (project_root / _OUTPUT_FLAGS_FILE).write_text(json.dumps(flags, sort_keys=True), encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️  could not record export flags: {e}")
+
 
 
 # ------------------------------- literal read ---------------------------
 
+def _sized(ws: Worksheet) -> Worksheet:
+    """
+    Make sure a read_only sheet knows its extent. Some writers leave out the
+    <dimension> tag or stamp a stale "A1:A1"; openpyxl then reports max_row None
+    (or 1) and every bounded iter_rows reads nothing. A sheet with no cells at all
+    stays unsized (max_row/max_column None); callers read that as 1.
+    """
+    if not ws.max_row or not ws.max_column or (ws.max_row == 1 and ws.max_column == 1):
+        ws.reset_dimensions()
+        try:
+            ws.calculate_dimension(force=True)
+        except Exception:
+            pass  # no cells; openpyxl can't size an empty sheet
+    return ws
+
 def _excel_col_to_idx(label: str) -> int:
-    s = re.sub(r"[^A-Za-z]", "", str(label)).upper()
+    s = str(label).strip()
+    if not (s.isascii() and s.isalpha()):
+        s = re.sub(r"[^A-Za-z]", "", s)
     if not s: return 0
-    n = 0
-    for ch in s:
-        n = n * 26 + (ord(ch) - ord("A") + 1)
-    return n - 1
+    return column_index_from_string(s.upper()) - 1  # ValueError past ZZZ
 
-def read_literal_table(xlsm_path: Path, sheet: str,
-                       header_row: Optional[int],
-                       data_start_row: Optional[int],
-                       limit_to_col: Optional[str] = None) -> pd.DataFrame:
+def _read_literal_rows(ws: Worksheet, header_row: Optional[int], data_start_row: Optional[int],
+                      max_c: int) -> tuple[List[str], List[List[str]]]:
     """
-    Read a sheet using openpyxl and return a DataFrame of *strings* matching Excel display.
-    `limit_to_col` (e.g., "AE") caps the rightmost column read.
+    Headers + display-string rows; stops at two consecutive blank rows.
+    The sheet is streamed once — each ws[r] on a read_only sheet is a fresh row parse.
+    """
+    n_rows = ws.max_row or 1
+    rows = ws.iter_rows(min_row=1, max_row=n_rows, max_col=max_c)
+    if header_row is None or data_start_row is None:
+        head = list(islice(rows, min(8, n_rows)))
+        best_r, best_nonempty = 1, -1
+        for r, cells in enumerate(head, start=1):
+            nonempty = sum(1 for c in cells if c.value not in (None, ""))
+            if nonempty > best_nonempty:
+                best_nonempty = nonempty
+                best_r = r
+        header_row = best_r
+        data_start_row = best_r + 1
+        rows = chain(head, rows)
+    header_row, data_start_row = int(header_row), int(data_start_row)
+
+    header_cells = None
+    out_rows: List[List[str]] = []
+    blanks_in_a_row = 0
+    for r, cells in enumerate(rows, start=1):
+        if r == header_row:
+            header_cells = cells
+        if r < data_start_row:
+            continue
+        row = [_format_cell(c) for c in cells]
+        if all(v == "" for v in row):
+            blanks_in_a_row += 1
+            if blanks_in_a_row >= 2: break
+            continue
+        blanks_in_a_row = 0
+        out_rows.append(row)
+    if header_cells is None:  # header sits below where the data stopped
+        header_cells = ws[header_row][0:max_c]
+
+    raw_headers = [_format_cell(c) for c in header_cells]
+    raw_headers = [_norm_header_label(h) for h in raw_headers]
+    headers = dedup(raw_headers)
+    return headers, out_rows
+
+def _format_value(v: Any, number_format: str) -> str:
+    """_format_cell for a bare calamine value (empty cells come back as "")."""
+    t = type(v)
+    if t is str:
+        return v.strip()
+    if t is float or t is int:
+        return _format_number(float(v), number_format)
+    if v is None:
+        return ""
+    if t is datetime.date:  # openpyxl hands dates back as midnight datetimes
+        v = datetime.datetime.combine(v, datetime.time())
+    if isinstance(v, (datetime.date, datetime.time)):
+        return str(v)
+    if isinstance(v, (int, float)):
+        return _format_number(float(v), number_format)
+    return str(v).strip()
+
+def _read_calamine_rows(ws: Worksheet, xlsm_path: Path, sheet: str,
+                        header_row: Optional[int], data_start_row: Optional[int],
+                        max_c: int) -> tuple[List[str], List[List[str]]]:
     """
-    wb = load_workbook(xlsm_path, data_only=True, read_only=True, keep_links=False)
+    _read_literal_rows with values from python-calamine. openpyxl only streams down to the
+    first data row for number formats, so every column is assumed to keep one format.
+    """
+    grid = CalamineWorkbook.from_path(str(xlsm_path)).get_sheet_by_name(sheet).to_python(skip_empty_area=False)
+    if header_row is None or data_start_row is None:
+        best_r, best_nonempty = 1, -1
+        for r, vals in enumerate(grid[:8], start=1):
+            nonempty = sum(1 for v in vals[:max_c] if v not in (None, ""))
+            if nonempty > best_nonempty:
+                best_nonempty = nonempty
+                best_r = r
+        header_row = best_r
+        data_start_row = best_r + 1
+    header_row, data_start_row = int(header_row), int(data_start_row)
+
+    first = min(header_row, data_start_row)
+    fmt_rows = list(ws.iter_rows(min_row=first, max_row=max(header_row, data_start_row), max_col=max_c))
+    pad = [""] * max_c
+
+    def formats(r: int) -> List[str]:
+        i = r - first
+        return [c.number_format or "" for c in fmt_rows[i]] if i < len(fmt_rows) else pad
+
+    def cells(r: int) -> list:
+        vals = grid[r - 1][:max_c] if r <= len(grid) else []
+        return vals + pad[len(vals):]
+
+    fmts = formats(data_start_row)
+    out_rows: List[List[str]] = []
+    blanks_in_a_row = 0
+    for r in range(data_start_row, len(grid) + 1):
+        row = [_format_value(v, f) for v, f in zip(cells(r), fmts)]
+        if all(v == "" for v in row):
+            blanks_in_a_row += 1
+            if blanks_in_a_row >= 2: break
+            continue
+        blanks_in_a_row = 0
+        out_rows.append(row)
+
+    raw_headers = [_format_value(v, f) for v, f in zip(cells(header_row), formats(header_row))]
+    raw_headers = [_norm_header_label(h) for h in raw_headers]
+    return dedup(raw_headers), out_rows
+
+def _load_literal_rows(xlsm_path: XlsxSource, sheet: str,
+                       header_row: Optional[int],
+                       data_start_row: Optional[int],
+                       limit_to_col: Optional[str],
+                       engine: str = "openpyxl",
+                       wb: Optional[Any] = None) -> tuple[List[str], List[List[str]]]:
+    owned = wb is None
+    if owned:
+        wb = load_workbook(xlsm_path, data_only=True, read_only=True, keep_links=False)
     try:
         if sheet not in wb.sheetnames:
             raise ValueError(f"Sheet not found: {sheet}")
-        ws = wb[sheet]
+        ws = _sized(wb[sheet])
 
-        max_c = ws.max_column
+        max_c = ws.max_column or 1
         if limit_to_col:
             try:
                 max_c = min(max_c, _excel_col_to_idx(limit_to_col) + 1)
             except Exception:
                 pass
+        if engine == "calamine":
+            if CalamineWorkbook is not None:
+                return _read_calamine_rows(ws, xlsm_path, sheet, header_row, data_start_row, max_c)
+            print(f"⚠️  '{sheet}': python-calamine is not installed; reading with openpyxl")
+        return _read_literal_rows(ws, header_row, data_start_row, max_c)
+    finally:
+        if owned:
+            wb.close()
+
+def read_literal_table(xlsm_path: XlsxSource, sheet: str,
+                       header_row: Optional[int],
+                       data_start_row: Optional[int],
+                       limit_to_col: Optional[str] = None,
+                       engine: str = "openpyxl",
+                       wb: Optional[Any] = None) -> pd.DataFrame:
+    """
+    Read a sheet using openpyxl and return a DataFrame of *strings* matching Excel display.
+    `limit_to_col` (e.g., "AE") caps the rightmost column read.
+    `engine="calamine"` reads values with python-calamine (see _read_calamine_rows).
+    `wb` reuses an open read_only workbook instead of loading `xlsm_path` again.
+    """
+    headers, out_rows = _load_literal_rows(xlsm_path, sheet, header_row, data_start_row, limit_to_col, engine, wb)
+    # rows are already all strings with blank rows skipped, so only empty columns need dropping
+    arr = np.array(out_rows, dtype=object).reshape(len(out_rows), len(headers))
+    col_keep = (arr != "").any(axis=0)
+    return pd.DataFrame(arr[:, col_keep], columns=[h for h, k in zip(headers, col_keep) if k])
+
+def read_literal_records(xlsm_path: XlsxSource, sheet: str,
+                         header_row: Optional[int],
+                         data_start_row: Optional[int],
+                         limit_to_col: Optional[str] = None,
+                         engine: str = "openpyxl",
+                         wb: Optional[Any] = None) -> tuple[List[str], List[Dict[str, str]]]:
+    """
+    Same read as read_literal_table, as (columns, list of row dicts) — no pandas.
+    All-blank columns are dropped, like the DataFrame version.
+    """
+    headers, out_rows = _load_literal_rows(xlsm_path, sheet, header_row, data_start_row, limit_to_col, engine, wb)
+    keep = [i for i in range(len(headers)) if any(row[i] != "" for row in out_rows)]
+    if len(keep) < len(headers):
+        out_rows = [[row[i] for i in keep] for row in out_rows]
+    cols = tuple(headers[i] for i in keep)
+    return list(cols), [dict(zip(cols, row)) for row in out_rows]
 
-        if header_row is None or data_start_row is None:
-            scan = min(8, ws.max_row)
-            best_r, best_nonempty = 1, -1
-            for r in range(1, scan + 1):
-                vals = [c.value for c in ws[r][0:max_c]]
-                nonempty = sum(1 for x in vals if x not in (None, ""))
-                if nonempty > best_nonempty:
-                    best_nonempty = nonempty
-                    best_r = r
-            header_row = best_r
-            data_start_row = best_r + 1
-
-        raw_headers = [_format_cell(c) for c in ws[header_row][0:max_c]]
-        raw_headers = [_norm_header_label(h) for h in raw_headers]
-        headers = dedup(raw_headers)
-
-        out_rows: List[List[str]] = []
+
+# ------------------------- optional CSV fast path ------------------------
+
+def _stage_sheet_csvs(staged_xlsm: Path, out_dir: Path, sheets: Iterable[str]) -> Optional[Path]:
+    """Dump each task sheet to <out_dir>/csv/<sheet>.csv once with xlsx2csv (None if unavailable)."""
+    if Xlsx2csv is None:
+        print("⚠️  --fast-csv: xlsx2csv is not installed; reading sheets with openpyxl")
+        return None
+    csv_dir = out_dir / "csv"
+    ensure_dir(csv_dir)
+    conv = Xlsx2csv(str(staged_xlsm), outputencoding="utf-8")
+    for sheet in dict.fromkeys(sheets):
+        try:
+            conv.convert(str(csv_dir / f"{sheet}.csv"), sheetname=sheet)
+        except Exception as e:
+            print(f"⚠️  --fast-csv: '{sheet}' not converted ({e}); using openpyxl")
+    return csv_dir
+
+def read_csv_table(csv_path: Path,
+                   header_row: Optional[int],
+                   data_start_row: Optional[int],
+                   limit_to_col: Optional[str] = None) -> pd.DataFrame:
+    """
+    Values-only twin of read_literal_table over an xlsx2csv dump. Same header
+    autodetect, blank-row stop and column cleanup, but cell text is whatever
+    xlsx2csv wrote — number formats are not applied.
+    """
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        rows = [[v.strip() for v in row] for row in csv.reader(fh)]
+    max_c = max((len(r) for r in rows), default=0)
+    if limit_to_col:
+        try:
+            max_c = min(max_c, _excel_col_to_idx(limit_to_col) + 1)
+        except Exception:
+            pass
+    rows = [(r + [""] * (max_c - len(r)))[:max_c] for r in rows]
+
+    if header_row is None or data_start_row is None:
+        best_r, best_nonempty = 1, -1
+        for r, vals in enumerate(rows[:8], start=1):
+            nonempty = sum(1 for x in vals if x)
+            if nonempty > best_nonempty:
+                best_nonempty = nonempty
+                best_r = r
+        header_row = best_r
+        data_start_row = best_r + 1
+
+    raw_headers = rows[int(header_row) - 1] if 0 < int(header_row) <= len(rows) else [""] * max_c
+    headers = dedup([_norm_header_label(h) for h in raw_headers])
+
+    out_rows: List[List[str]] = []
+    blanks_in_a_row = 0
+    for row in rows[int(data_start_row) - 1:]:
+        if not any(row):
+            blanks_in_a_row += 1
+            if blanks_in_a_row >= 2: break
+            continue
         blanks_in_a_row = 0
-        for r in range(int(data_start_row), ws.max_row + 1):
-            cells = ws[r][0:max_c]
-            row = [_format_cell(c) for c in cells]
-            if all(v == "" for v in row):
-                blanks_in_a_row += 1
-                if blanks_in_a_row >= 2: break
-                continue
-            blanks_in_a_row = 0
-            out_rows.append(row)
-
-        df = pd.DataFrame(out_rows, columns=headers)
-        df = df.dropna(axis=0, how="all")
-        df = df.replace("", np.nan).dropna(axis=0, how="all").fillna("")
-        df = df.loc[:, ~(df.astype(str).eq("").all())]
-        return df
-    finally:
-        wb.close()
+        out_rows.append(row)
+
+    df = pd.DataFrame(out_rows, columns=headers)
+    return df.loc[:, ~(df.eq("").all())]
 
 
 # -------------------------- cheatsheets (by title) ----------------------
 
-def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> None:
+_TIME12_RE = re.compile(r"^\s*(\d{1,2})\s*:\s*(\d{2})(?::\d{2})?\s*(AM|PM)?\s*$", re.I)
+
+@lru_cache(maxsize=512)
+def _to_12h(s: Any) -> str:
+    if s is None: return ""
+    t = str(s).strip()
+    if not t: return ""
+    m = _TIME12_RE.match(t)
+    if not m: return t
+    hh = int(m.group(1)); mm = m.group(2); ampm = m.group(3)
+    if ampm: return f"{hh}:{mm} {ampm.upper()}"
+    if hh == 0:  return f"12:{mm} AM"
+    if hh <= 11: return f"{hh}:{mm} AM"
+    if hh == 12:return f"12:{mm} PM"
+    return f"{hh-12}:{mm} PM"
+
+_HL_RE = re.compile(r"^=\s*HYPERLINK\s*\(\s*(?:\"[^\"]*\"|[^,]+)\s*,\s*\"([^\"]+)\"\s*\)\s*$", re.I)
+
+def _hyperlink_display(val: Any) -> Optional[str]:
+    if val is None:
+        return None
+    s = str(val)
+    # plain values and other formulas never reach the regex engine
+    if s[:1] != "=" or s[1:].lstrip()[:9].lower() != "hyperlink":
+        return None
+    # common shape =HYPERLINK("url","name") — slice it out without the regex
+    if s[:12].upper() == '=HYPERLINK("' and s.endswith('")') and s.count('"') == 4:
+        q = s.find('"', 12)
+        if s[q:q + 3] == '","' and q + 3 < len(s) - 2:
+            return s[q + 3:-2].strip()
+    m = _HL_RE.match(s)
+    return m.group(1).strip() if m else None
+
+def run_cheatsheets(xlsm_path: XlsxSource, project_root: Path, cfg: Dict[str, Any],
+                    wb: Optional[Any] = None) -> None:
     """
     Title-based extraction, column-scoped.
     - Auto-detect header row (either the yellow title row or the row below).
@@ -365,55 +855,50 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
     out_rel    = (cs.get("out_rel") or "").lstrip(r"\/")
     title_ci   = bool(cs.get("title_match_ci", True))
     default_limit = int(cs.get("limit_rows", 200))
+    resolve_links = bool(cs.get("resolve_hyperlink_players", True))
     if not out_rel:
         print("⚠️  SKIP cheatsheets: missing out_rel")
         return
 
     # helpers --------------------------------------------------------------
-    _TIME12_RE = re.compile(r"^\s*(\d{1,2})\s*:\s*(\d{2})(?::\d{2})?\s*(AM|PM)?\s*$", re.I)
-    def _to_12h(s: Any) -> str:
-        if s is None: return ""
-        t = str(s).strip()
-        if not t: return ""
-        m = _TIME12_RE.match(t)
-        if not m: return t
-        hh = int(m.group(1)); mm = m.group(2); ampm = m.group(3)
-        if ampm: return f"{hh}:{mm} {ampm.upper()}"
-        if hh == 0:  return f"12:{mm} AM"
-        if hh <= 11: return f"{hh}:{mm} AM"
-        if hh == 12:return f"12:{mm} PM"
-        return f"{hh-12}:{mm} PM"
-
-    _HL_RE = re.compile(r"^=\s*HYPERLINK\s*\(\s*(?:\"[^\"]*\"|[^,]+)\s*,\s*\"([^\"]+)\"\s*\)\s*$", re.I)
-    def _hyperlink_display(val: Any) -> Optional[str]:
-        s = "" if val is None else str(val)
-        m = _HL_RE.match(s)
-        return m.group(1).strip() if m else None
-
     def norm(s: Any) -> str:
         txt = "" if s is None else str(s).strip()
         return txt.lower() if title_ci else txt
 
     # ---------------------------------------------------------------------
-    wb_data = load_workbook(xlsm_path, data_only=True,  read_only=True, keep_links=False)
-    wb_form = load_workbook(xlsm_path, data_only=False, read_only=True, keep_links=False)
+    wb_data = wb if wb is not None else load_workbook(xlsm_path, data_only=True, read_only=True, keep_links=False)
+    formulas: Optional[List[tuple]] = None   # formula view, read only when a blank Player cell needs it
     try:
         if sheet not in wb_data.sheetnames:
             print(f"⚠️  SKIP cheatsheets: sheet '{sheet}' not found")
             return
-        ws  = wb_data[sheet]
-        wsf = wb_form[sheet]
-        n_rows, n_cols = ws.max_row, ws.max_column
+        ws  = _sized(wb_data[sheet])
+        n_rows, n_cols = ws.max_row or 1, ws.max_column or 1
 
         titles_cfg = cs.get("tables") or []
         all_titles_norm = {norm(t.get("title")) for t in titles_cfg if t.get("title")}
 
-        # index of text → [(r,c)]
+        # stream the sheet once; every lookup below indexes this grid instead of
+        # ws.cell, which re-reads the row on a read_only sheet
+        grid: List[tuple] = [()]
+        for row in ws.iter_rows(min_row=1, max_row=n_rows, max_col=n_cols):
+            grid.append((EMPTY_CELL,) + tuple(row))
+
+        def cell_at(r: int, c: int):
+            if 0 < r < len(grid) and 0 < c < len(grid[r]):
+                return grid[r][c]
+            return EMPTY_CELL
+
+        # index of title text → [(r,c)]; only the titles we look up are kept
+        wanted = {norm(str(t.get("title") or f"Table {i+1}").strip()) for i, t in enumerate(titles_cfg)}
         index: Dict[str, List[tuple]] = {}
-        for r in range(1, n_rows + 1):
-            for c in range(1, n_cols + 1):
-                s = norm(ws.cell(r, c).value)
-                if s:
+        for r in range(1, len(grid)):
+            for c, cell in enumerate(grid[r][1:], start=1):
+                v = cell.value
+                if v is None:
+                    continue
+                s = norm(v)
+                if s in wanted:
                     index.setdefault(s, []).append((r, c))
 
         EXPECTED = {"player","salary","team","matchup","vegas","time","proj","value","pown"}
@@ -423,7 +908,7 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
             candidates = [start_r, start_r + 1]
             best_r, best_score = start_r, -1
             for r0 in candidates:
-                cells = [ws.cell(r0, c) for c in range(start_c, min(start_c+width, n_cols+1))]
+                cells = [cell_at(r0, c) for c in range(start_c, min(start_c+width, n_cols+1))]
                 labels = [ _norm_header_label(_format_cell(c)) for c in cells ]
                 labels_l = [l.lower() for l in labels]
                 score = sum(1 for l in labels_l if l in EXPECTED)
@@ -451,7 +936,7 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
                 data_r0  = header_r + 1
 
                 # headers within span
-                hdr = [ws.cell(header_r, c) for c in range(start_c, min(start_c + width, n_cols + 1))]
+                hdr = [cell_at(header_r, c) for c in range(start_c, min(start_c + width, n_cols + 1))]
                 headers = dedup([_norm_header_label(_format_cell(c)) for c in hdr])
 
                 # locate special columns
@@ -465,16 +950,27 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
                 blanks = 0
                 while r <= n_rows and len(rows) < limit_rows:
                     # stop when a new section title appears in the first cell (any title)
-                    first = norm(ws.cell(r, start_c).value)
+                    first = norm(cell_at(r, start_c).value)
                     if first and first in all_titles_norm:
                         break
 
-                    row_cells = [ws.cell(r, c) for c in range(start_c, start_c + len(headers))]
+                    row_cells = [cell_at(r, c) for c in range(start_c, start_c + len(headers))]
                     display   = [_format_cell(c) for c in row_cells]
 
                     # fill 'Player' from formula if needed
-                    if idx_player is not None and not display[idx_player]:
-                        raw = wsf.cell(r, start_c + idx_player).value
+                    if resolve_links and idx_player is not None and not display[idx_player]:
+                        if formulas is None:
+                            # one streamed pass, only if some Player cell has no cached value; the
+                            # formula view can't replace the data pass since it loses every cached result
+                            wb_form = load_workbook(xlsm_path, data_only=False, read_only=True, keep_links=False)
+                            try:
+                                wsf = wb_form[sheet]
+                                formulas = [()] + [(None,) + row for row in wsf.iter_rows(
+                                    max_row=n_rows, max_col=n_cols, values_only=True)]
+                            finally:
+                                wb_form.close()
+                        fc = start_c + idx_player
+                        raw = formulas[r][fc] if r < len(formulas) and fc < len(formulas[r]) else None
                         disp = _hyperlink_display(raw)
                         if disp:
                             display[idx_player] = disp
@@ -494,12 +990,9 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
                     rows.append(display)
                     r += 1
 
-                # Build frame for this occurrence
-                sub = pd.DataFrame(rows, columns=headers)
-
                 # ==== normalization (unchanged) ====
                 _PLAYER_SECTIONS = {"Pitcher","C","1B","2B","3B","SS","OF","Cash Core"}
-                cols = list(sub.columns)
+                cols = list(headers)
                 if title in _PLAYER_SECTIONS and cols and cols[0] == title:
                     cols[0] = "Player"
                 cols = ["Opp" if (c or "").lower() in ("matchup","opp") else c for c in cols]
@@ -515,10 +1008,10 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
                         if seen_first_team and cols[i2] == "Opp":
                             cols[i2] = "Opp Pitcher"
                             break
-                sub.columns = cols
                 # ===================================
 
-                recs = sub.astype(object).where(pd.notna(sub), "").to_dict(orient="records")
+                # rows are display strings already — straight to dicts, no DataFrame
+                recs = [dict(zip(cols, row)) for row in rows]
 
                 # merge multiple occurrences (e.g., all three "OF" blocks)
                 if title in out_obj and isinstance(out_obj[title], list):
@@ -527,13 +1020,14 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
                     out_obj[title] = recs
 
         out_path = (project_root / "public" / Path(out_rel)).with_suffix(".json")
-        ensure_parent(out_path)
-        out_path.write_text(json.dumps(out_obj, ensure_ascii=False, indent=2), encoding="utf-8")
+        _write_json_sections(out_path, out_obj)
         print(f"✔️  JSON → {out_path}  (sections: {', '.join(out_obj.keys()) or 'none'})")
+        if cs.get("gzip"):
+            _gzip_sidecar(out_path)
         _mark_meta_dir(out_path)
     finally:
-        wb_data.close()
-        wb_form.close()
+        if wb_data is not wb:
+            wb_data.close()
 
 
 # ---------------------- MLB GAMEBOARD (Dashboard) — FAST ----------------------
@@ -541,8 +1035,19 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
 # Flexible parser: pull AAA and BBB anywhere in the string (not anchored)
 _HEADER_PAT = re.compile(r"([A-Z]{2,4})\s*@\s*([A-Z]{2,4})")
 
+# Panel line patterns
+_TEAM_BAR_RE = re.compile(r"^\s*([A-Z]{2,4})\s*\(([0-9.]+)")
+_OU_RE       = re.compile(r"O/?U:\s*([0-9.]+)", re.I)
+_ML_RE       = re.compile(r"\b([A-Z]{2,4})\s*ML:\s*([+-]?\d+)", re.I)
+_SPREAD_RE   = re.compile(r"SPREAD:\s*([+-]?[0-9.]+)", re.I)
+
+# exact-type test for parsed odds; `type(x) in` skips isinstance's subclass walk
+_NUM_TYPES = (int, float)
+
+@lru_cache(maxsize=4096)
 def _parse_header(text: str) -> tuple[str, str] | None:
-    if not text:
+    # the same cell text is parsed by the row walk, the title slice and every player walk
+    if not text or "@" not in text:
         return None
     m = _HEADER_PAT.search(text.strip().upper())
     if not m:
@@ -552,23 +1057,40 @@ def _parse_header(text: str) -> tuple[str, str] | None:
         return a, b
     return None
 
-def _build_grid(ws: Worksheet, max_rows: int, max_cols: int) -> list[list[str]]:
-    """One pass streaming read → in-memory grid of strings."""
+def _build_grid(ws: Worksheet, max_rows: int, probe_rows: int = 40) -> tuple[list[list[str]], int]:
+    """
+    One pass streaming read → in-memory grid of strings, trimmed to the rightmost
+    column used in the first `probe_rows` rows. Returns (grid, n_cols).
+    """
+    n_rows = min(max_rows, ws.max_row or 1)
+    probe_rows = min(probe_rows, ws.max_row or 1)
+    rows = ws.iter_rows(min_row=1, max_row=max(n_rows, probe_rows),
+                        min_col=1, max_col=ws.max_column or 1, values_only=True)
+    return _trim_grid(rows, n_rows, probe_rows)
+
+def _build_grid_calamine(xlsm_path: Path, sheet: str, max_rows: int,
+                         probe_rows: int = 40) -> tuple[list[list[str]], int]:
+    """_build_grid from python-calamine values: no cell objects, no styles, one native parse."""
+    vals = CalamineWorkbook.from_path(str(xlsm_path)).get_sheet_by_name(sheet).to_python(skip_empty_area=False)
+    n_rows = min(max_rows, len(vals) or 1)
+    probe_rows = min(probe_rows, len(vals) or 1)
+    # calamine reads every number as float; openpyxl keeps whole ones as int ("5", not "5.0")
+    rows = ([int(v) if type(v) is float and v.is_integer() else v for v in row]
+            for row in islice(vals, max(n_rows, probe_rows)))
+    return _trim_grid(rows, n_rows, probe_rows)
+
+def _trim_grid(rows: Iterable[tuple], n_rows: int, probe_rows: int) -> tuple[list[list[str]], int]:
     grid = []
-    ncols = min(max_cols, ws.max_column or 1)
-    for row in ws.iter_rows(min_row=1, max_row=min(max_rows, ws.max_row or 1),
-                            min_col=1, max_col=ncols, values_only=True):
-        grid.append([("" if v is None else str(v).strip()) for v in row])
-    return grid
-
-def _row_has_any_text(grid: list[list[str]], r: int, c0: int = 0, c1: int | None = None) -> bool:
-    row = grid[r]
-    if c1 is None: c1 = len(row) - 1
-    c1 = min(c1, len(row) - 1)
-    for c in range(max(0, c0), c1 + 1):
-        if row[c]:
-            return True
-    return False
+    n_cols = 1
+    for i, row in enumerate(rows, start=1):
+        if i <= probe_rows and row:
+            last = len(row)
+            while last > n_cols and row[last - 1] in (None, ""):
+                last -= 1
+            n_cols = max(n_cols, last)
+        if i <= n_rows:
+            grid.append([("" if v is None else str(v).strip()) for v in row])
+    return [row[:n_cols] for row in grid], n_cols
 
 def _row_text_slice(grid: list[list[str]], r: int, c0: int, c1: int) -> str:
     row = grid[r]
@@ -585,10 +1107,12 @@ def _find_header_cols_in_row_grid(grid: list[list[str]], r: int) -> list[int]:
             cols.append(c)
     return cols
 
-def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> None:
+def run_matchups(xlsm_path: XlsxSource, project_root: Path, cfg: Dict[str, Any],
+                 wb: Optional[Any] = None, engine: str = "openpyxl") -> None:
     gb = cfg.get("gameboard")
     if not gb:
         return
+    engine = str(gb.get("engine", engine)).lower()
 
     out_rel = (gb.get("out_rel") or "").lstrip(r"\\/") or "data/mlb/latest/matchups"
 
@@ -597,7 +1121,9 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
     end_after_blank_rows = int(gb.get("end_after_blank_rows", 8))
     debug = bool(gb.get("debug", False))
 
-    wb = load_workbook(xlsm_path, data_only=True, read_only=True, keep_links=False)
+    owned = wb is None
+    if owned:
+        wb = load_workbook(xlsm_path, data_only=True, read_only=True, keep_links=False)
     try:
         # pick dashboard sheet
         want = gb.get("sheet") or ["MLB Game Dashboard", "MLB Dashboard", "Dashboard"]
@@ -618,33 +1144,35 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
 
         sheet_name = pick_sheet(want_list) or wb.sheetnames[0]
         print(f"• MLB Matchups (fast): using sheet '{sheet_name}'")
-        ws = wb[sheet_name]
-
-        # heuristic for max columns across early rows
-        probe_rows = min(40, ws.max_row or 1)
-        probe_max_col = 1
-        for row in ws.iter_rows(min_row=1, max_row=probe_rows, values_only=True):
-            if not row: continue
-            last_non_empty = 0
-            for idx, val in enumerate(row, start=1):
-                if val not in (None, ""):
-                    last_non_empty = idx
-            probe_max_col = max(probe_max_col, last_non_empty)
-
-        grid = _build_grid(ws, max_rows=max_scan_rows, max_cols=probe_max_col)
+        # width comes from the rightmost used column across the early rows
+        if engine == "calamine" and CalamineWorkbook is not None:
+            grid, n_cols = _build_grid_calamine(xlsm_path, sheet_name, max_rows=max_scan_rows)
+        else:
+            if engine == "calamine":
+                print("⚠️  matchups: python-calamine is not installed; reading with openpyxl")
+            grid, n_cols = _build_grid(_sized(wb[sheet_name]), max_rows=max_scan_rows)
         n_rows = len(grid)
-        n_cols = probe_max_col
-
+        # per-row masks, computed once up front instead of re-scanning cells in the walk
+        has_text = [any(row) for row in grid]
+        # only rows holding an '@' somewhere can carry a game header
+        at_rows = {i for i, row in enumerate(grid) if any("@" in x for x in row)}
+        # likewise a team bar ("NYY (4.8)") needs a '(' — skip the regex elsewhere
+        paren_rows = {i for i, row in enumerate(grid) if any("(" in x for x in row)}
+
+        # hot-loop aliases: LOAD_FAST instead of global/attribute lookups per row
+        team_bar_match = _TEAM_BAR_RE.match
+        parse_header = _parse_header
+        ou_search, ml_findall, spread_search = _OU_RE.search, _ML_RE.findall, _SPREAD_RE.search
         games: list[dict] = []
         header_hits = 0
 
         r = 0
         blank_streak = 0
         while r < n_rows:
-            header_cols = _find_header_cols_in_row_grid(grid, r)
+            header_cols = _find_header_cols_in_row_grid(grid, r) if r in at_rows else []
 
             if not header_cols:
-                if _row_has_any_text(grid, r, 0, n_cols - 1):
+                if has_text[r]:
                     blank_streak = 0
                 else:
                     blank_streak += 1
@@ -663,6 +1191,7 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
             header_cols_sorted = sorted(header_cols)
             for idx, c_start in enumerate(header_cols_sorted):
                 c_end = (header_cols_sorted[idx + 1] - 1) if idx + 1 < len(header_cols_sorted) else (n_cols - 1)
+                c_stop = c_end + 1
 
                 # Extract and parse "AAA @ BBB"
                 title_line = _row_text_slice(grid, r, c_start, c_end)
@@ -682,19 +1211,27 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
                     },
                 }
 
+                away_total_search = re.compile(rf"{away}\s*([0-9.]+)", re.I).search
+                home_total_search = re.compile(rf"{home}\s*([0-9.]+)", re.I).search
+                away_lines = g["team_blocks"]["away"]["lines"]
+                home_lines = g["team_blocks"]["home"]["lines"]
+
                 # Walk down to find the team bar row
                 k = r + 1
                 team_bar_row = None
                 while k < n_rows:
-                    row_slice = grid[k][c_start:c_end+1]
+                    if not has_text[k]:
+                        k += 1
+                        continue
+                    row_slice = grid[k][c_start:c_stop]
                     if not any(row_slice):
                         k += 1
                         continue
                     left  = next((x for x in row_slice if x), "")
                     right = next((x for x in reversed(row_slice) if x), "")
 
-                    mL = re.match(r"^\s*([A-Z]{2,4})\s*\(([0-9.]+)", left or "")
-                    mR = re.match(r"^\s*([A-Z]{2,4})\s*\(([0-9.]+)", right or "")
+                    mL = team_bar_match(left) if k in paren_rows else None
+                    mR = team_bar_match(right) if mL else None
                     if mL and mR:
                         g["team_blocks"]["away"]["header"] = f"{mL.group(1)} ({mL.group(2)})"
                         g["team_blocks"]["home"]["header"] = f"{mR.group(1)} ({mR.group(2)})"
@@ -703,6 +1240,10 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
                             g["imp_home"] = float(mR.group(2))
                         except Exception:
                             pass
+                        # odds lines only sit above the team bar, so the implied totals are final here
+                        ih, ia = g["imp_home"], g["imp_away"]
+                        if g["ou"] is None and type(ih) in _NUM_TYPES and type(ia) in _NUM_TYPES:
+                            g["ou"] = float(ih + ia)
                         team_bar_row = k
                         break
 
@@ -710,17 +1251,17 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
                     U = whole.upper()
 
                     if "O/U" in U:
-                        m_ou = re.search(r"O/?U:\s*([0-9.]+)", whole, flags=re.I)
+                        m_ou = ou_search(whole)
                         if m_ou: g["ou"] = float(m_ou.group(1))
-                        for tm, ml in re.findall(r"\b([A-Z]{2,4})\s*ML:\s*([+-]?\d+)", whole, flags=re.I):
+                        for tm, ml in ml_findall(whole):
                             if tm.upper() == away: g["ml_away"] = int(ml)
                             if tm.upper() == home: g["ml_home"]  = int(ml)
                     elif "SPREAD" in U:
-                        mH = re.search(r"SPREAD:\s*([+-]?[0-9.]+)", whole, flags=re.I)
+                        mH = spread_search(whole)
                         if mH: g["spread_home"] = float(mH.group(1))
                     elif "TOTAL" in U:
-                        mA = re.search(rf"{away}\s*([0-9.]+)", whole, flags=re.I)
-                        mH = re.search(rf"{home}\s*([0-9.]+)", whole, flags=re.I)
+                        mA = away_total_search(whole)
+                        mH = home_total_search(whole)
                         if mA: g["imp_away"] = float(mA.group(1))
                         if mH: g["imp_home"]  = float(mH.group(1))
                     elif "WEATHER" in U:
@@ -737,18 +1278,25 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
                 k = team_bar_row + 1
                 local_blanks = 0
                 while k < n_rows:
+                    # a row blank across the whole grid is blank in our window too
+                    if not has_text[k]:
+                        local_blanks += 1
+                        if local_blanks >= 2:
+                            break
+                        k += 1
+                        continue
+
+                    row_slice = grid[k][c_start:c_stop]
+
                     # stop if a new header appears inside our window
-                    row_hdr_cols = [c for c in _find_header_cols_in_row_grid(grid, k) if c_start <= c <= c_end]
-                    if row_hdr_cols:
+                    if k in at_rows and any(x and "@" in x and parse_header(x) for x in row_slice):
                         break
 
-                    row_slice = grid[k][c_start:c_end+1]
                     left  = next((x for x in row_slice if x), "")
                     right = next((x for x in reversed(row_slice) if x), "")
 
                     # also stop if team-bar repeats
-                    if re.match(r"^\s*[A-Z]{2,4}\s*\([0-9.]+", left or "") and \
-                       re.match(r"^\s*[A-Z]{2,4}\s*\([0-9.]+", right or ""):
+                    if k in paren_rows and team_bar_match(left) and team_bar_match(right):
                         break
 
                     if not left and not right:
@@ -759,13 +1307,10 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
                         continue
 
                     local_blanks = 0
-                    if left:  g["team_blocks"]["away"]["lines"].append(left)
-                    if right: g["team_blocks"]["home"]["lines"].append(right)
+                    if left:  away_lines.append(left)
+                    if right: home_lines.append(right)
                     k += 1
 
-                if g.get("ou") is None and all(isinstance(g.get(k2), (int, float)) for k2 in ("imp_home","imp_away")):
-                    g["ou"] = float(g["imp_home"]) + float(g["imp_away"])
-
                 games.append(g)
 
             r += 1
@@ -774,12 +1319,15 @@ def run_matchups(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
             print(f"• header candidates seen: {header_hits}")
 
         out_path = (project_root / "public" / Path(out_rel)).with_suffix(".json")
-        ensure_parent(out_path)
-        out_path.write_text(json.dumps(games, ensure_ascii=False, indent=2), encoding="utf-8")
+        with _atomic_target(out_path) as tmp:
+            _dump_file(games, tmp)
         print(f"✔️  JSON → {out_path}  (games: {len(games)})")
+        if gb.get("gzip"):
+            _gzip_sidecar(out_path)
         _mark_meta_dir(out_path)
     finally:
-        wb.close()
+        if owned:
+            wb.close()
 
 
 # --------------------------------- config --------------------------------
@@ -804,7 +1352,18 @@ def main() -> None:
     ap.add_argument("--xlsm",    default=DEFAULT_XLSM,   help="Path to the source workbook (.xls/.xlsx/.xlsm)")
     ap.add_argument("--project", default=DEFAULT_PROJ,   help="Path to project root (contains /public)")
     ap.add_argument("--config",  default=DEFAULT_CONFIG, help="Path to exporter config JSON")
+    ap.add_argument("--workers", type=int, default=1, help="Processes for sheet tasks (default 1 = sequential, sharing one workbook parse; 0 = one per task up to CPU count)")
+    ap.add_argument("--fast-csv", action="store_true", help="Dump task sheets with xlsx2csv and read those (values only, no number formats)")
+    ap.add_argument("--engine", choices=("openpyxl", "calamine"), default="openpyxl",
+                    help="Default reader for task sheets and matchups; a task's/gameboard's own \"engine\" key wins (cheatsheets always use openpyxl)")
+    ap.add_argument("--gzip", action="store_true",
+                    help="Also write a precompressed .json.gz next to every JSON output (a config section's own \"gzip\" key wins)")
+    ap.add_argument("--incremental", action="store_true",
+                    help="Skip sheet tasks whose outputs are newer than both the workbook and the config (all rerun if --compact-json/--fast-csv changed)")
+    ap.add_argument("--compact-json", action="store_true",
+                    help="Write JSON without indentation (smaller, but unreadable diffs for tracked files)")
     args = ap.parse_args()
+    _set_json_compact(args.compact_json)
 
     xlsm_path     = Path(args.xlsm).resolve()
     project_root  = _choose_project_root(args.project)
@@ -815,29 +1374,93 @@ def main() -> None:
     if not config_path.exists():
         print(f"ERROR: config not found: {config_path}", file=sys.stderr); sys.exit(1)
 
-    staged_xlsm, temp_dir = _stage_copy_for_read(xlsm_path)
+    # snapshot the workbook in one read so Excel can keep saving it meanwhile;
+    # a temp copy is only written for readers that need a real path
+    data = xlsm_path.read_bytes()
+    temp_dir: Optional[Path] = None
+    wb = None
 
     try:
-        cfg = json.loads(config_path.read_text(encoding="utf-8-sig"))
+        cfg = json.loads(config_path.read_bytes())  # bytes: json detects UTF-8 and skips a BOM
 
         tasks = cfg.get("tasks", [])
         if not isinstance(tasks, list):
             print("ERROR: config 'tasks' must be an array.", file=sys.stderr); sys.exit(1)
-
-        for t in tasks:
-            sheet = t.get("sheet")
-            print(f"\n=== TASK: sheet='{sheet}' | out='{t.get('out_rel','?')}' ===")
-            try:
-                run_task(staged_xlsm, project_root, t)
-            except Exception as e:
-                print(f"⚠️  SKIP: task failed: {e}")
+        if args.engine != "openpyxl":
+            tasks = [{"engine": args.engine, **t} for t in tasks]
+        if args.gzip:
+            tasks = [{"gzip": True, **t} for t in tasks]
+            for key in ("cheatsheets", "gameboard"):
+                if isinstance(cfg.get(key), dict):
+                    cfg[key] = {"gzip": True, **cfg[key]}
+        out_flags = {"compact_json": args.compact_json, "fast_csv": args.fast_csv}
+        if args.incremental and _output_flags_changed(project_root, out_flags):
+            print("• output flags differ from the last run; rebuilding every task")
+        elif args.incremental:
+            since = max(xlsm_path.stat().st_mtime, config_path.stat().st_mtime)
+            stale = []
+            for t in tasks:
+                if _task_is_fresh(project_root, t, since):
+                    print(f"• up to date, skipping task: sheet='{t.get('sheet')}' | out='{t.get('out_rel')}'")
+                else:
+                    stale.append(t)
+            tasks = stale
+
+        workers = args.workers or min(len(tasks), os.cpu_count() or 1)
+        needs_file = (args.fast_csv or args.engine == "calamine" or (workers > 1 and len(tasks) > 1)
+                      or any(str(t.get("engine", "")).lower() == "calamine"
+                             for t in tasks + [cfg.get("gameboard") or {}]))
+        if needs_file:
+            staged_xlsm, temp_dir = _stage_copy_for_read(xlsm_path, data)
+        else:
+            staged_xlsm = io.BytesIO(data)
+
+        # one read_only handle for everything run in this process; opening parses
+        # the zip directory, workbook.xml and sharedStrings each time
+        wb = load_workbook(staged_xlsm, data_only=True, read_only=True, keep_links=False)
+
+        csv_dir = None
+        if args.fast_csv:
+            csv_dir = _stage_sheet_csvs(staged_xlsm, temp_dir, [t.get("sheet") for t in tasks if t.get("sheet")])
+
+        failed = False
+        if workers > 1 and len(tasks) > 1:
+            # tasks read the staged copy and write distinct out_rel paths, so they
+            # run independently; meta dirs come back to this process
+            print(f"\n=== TASKS ({len(tasks)} across {workers} processes) ===")
+            with ProcessPoolExecutor(max_workers=workers, initializer=_set_json_compact,
+                                     initargs=(args.compact_json,)) as ex:
+                futs = {ex.submit(_run_task_worker, staged_xlsm, project_root, t, csv_dir): t for t in tasks}
+                for fut in as_completed(futs):
+                    t = futs[fut]
+                    try:
+                        dirs, err = fut.result()
+                    except Exception as e:
+                        dirs, err = [], str(e)
+                    _META_DIRS.update(dirs)
+                    if err:
+                        failed = True
+                        print(f"⚠️  SKIP: task '{t.get('sheet')}' failed: {err}")
+        else:
+            for t in tasks:
+                sheet = t.get("sheet")
+                print(f"\n=== TASK: sheet='{sheet}' | out='{t.get('out_rel','?')}' ===")
+                try:
+                    run_task(staged_xlsm, project_root, t, csv_dir, wb)
+                except Exception as e:
+                    failed = True
+                    print(f"⚠️  SKIP: task failed: {e}")
+
+        if not failed:
+            # a failed task may still hold files written under the old flags
+            _save_output_flags(project_root, out_flags)
 
         print("\n=== CHEAT SHEET ===")
-        try: run_cheatsheets(staged_xlsm, project_root, cfg)
+        try: run_cheatsheets(staged_xlsm, project_root, cfg, wb)
         except Exception as e: print(f"⚠️  SKIP cheatsheets: {e}")
 
         print("\n=== MATCHUPS (MLB Dashboard) ===")
-        try: run_matchups(staged_xlsm, project_root, cfg)
+        try: run_matchups(staged_xlsm, project_root, cfg, wb, args.engine)
         except Exception as e: print(f"⚠️  SKIP matchups: {e}")
 
         # finally write meta files for all touched dirs
@@ -846,8 +1469,11 @@ def main() -> None:
 
         print("\nDone.")
     finally:
-        try: shutil.rmtree(temp_dir, ignore_errors=True)
-        except Exception: pass
+        if wb is not None:
+            wb.close()
+        if temp_dir is not None:
+            try: shutil.rmtree(temp_dir, ignore_errors=True)
+            except Exception: pass
 
 
 if __name__ == "__main__":
@@ -22,17 +22,24 @@ Export selected sheets from an Excel .xlsm workbook into CSV and/or JSON files.
 from __future__ import annotations
 import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 import re
 import sys
 import shutil
 import tempfile
-from typing import Iterable, List, Dict, Any, Optional, Union
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 from datetime import datetime, timezone
 import time
 
 import numpy as np
 import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES
+
+from export_common import combine_masks, filter_re, str_contains, to_json_records
 
 # --------------------- DEFAULTS ---------------------
 DEFAULT_XLSM   = r"C:\Users\cpenn\Dropbox\Sports Models\2025 NASCAR\Cup Bass Pro Shops Night Race Bristol.xlsm"
@@ -40,6 +47,14 @@ DEFAULT_PROJ   = r"C:\Users\cpenn\Downloads\cpenn-dfs_frontend-v1"
 DEFAULT_CONFIG = r"C:\Users\cpenn\Downloads\cpenn-dfs_frontend-v1\scripts\configs\nascar_cup.json"
 # ---------------------------------------------------
 
+# optional: python-calamine as the pandas read engine (--engine calamine, pandas >= 2.2).
+# Nothing in this exporter looks at fills or number formats, so either reader works.
+try:
+    import python_calamine  # noqa: F401
+    _HAVE_CALAMINE = True
+except ImportError:
+    _HAVE_CALAMINE = False
+
 # Directories that should receive a meta.json (populated as we export)
 _META_DIRS: set[Path] = set()
 
@@ -51,16 +66,30 @@ def _stage_copy_for_read(src: Path) -> tuple[Path, Path]:
     """Copy workbook to a temp folder so we can read while Excel remains open."""
     tmpdir = Path(tempfile.mkdtemp(prefix="nascar_export_"))
     dst = tmpdir / src.name
-    shutil.copy2(src, dst)
+    shutil.copyfile(src, dst)
     return dst, tmpdir
 
+_XLSX_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+def _sheet_names(xlsm_path: Path) -> List[str]:
+    """Sheet names straight from xl/workbook.xml — no need to parse the whole workbook for them."""
+    try:
+        with zipfile.ZipFile(xlsm_path) as z:
+            root = ET.fromstring(z.read("xl/workbook.xml"))
+        return [s.get("name") for s in root.iter(f"{_XLSX_MAIN_NS}sheet")]
+    except (KeyError, zipfile.BadZipFile, ET.ParseError):
+        with pd.ExcelFile(xlsm_path, engine="openpyxl") as xl:
+            return list(xl.sheet_names)
+
 def _excel_col_to_idx(label: str) -> int:
-    s = re.sub(r"[^A-Za-z]", "", str(label)).upper()
+    s = str(label).strip()
+    if not (s.isascii() and s.isalpha()):  # plain "A"/"BC" labels skip the regex
+        s = re.sub(r"[^A-Za-z]", "", s)
     if not s:
         return 0
     n = 0
-    for ch in s:
-        n = n * 26 + (ord(ch) - ord("A") + 1)
+    for ch in s.upper():
+        n = n * 26 + (ord(ch) - 64)
     return n - 1
 
 def _slice_by_range(df: pd.DataFrame, rng: str) -> pd.DataFrame:
@@ -78,19 +107,24 @@ def dedup(names: Iterable) -> List[str]:
     seen: Dict[str,int] = {}
     out: List[str] = []
     for i, raw in enumerate(list(names)):
-        if raw is None:
+        if isinstance(raw, str):
+            s = raw.strip()
+        elif raw is None:
             s = ""
         else:
             try:
                 s = "" if pd.isna(raw) else str(raw).strip()
             except Exception:
                 s = str(raw).strip()
-        try:
-            f = float(s)
-            if abs(f - round(f)) < 1e-9:
-                s = str(int(round(f)))
-        except Exception:
-            pass
+        # only numeric-looking labels can collapse to an int string; skip the
+        # float() attempt (and its exception) for ordinary text headers
+        if s and (s[0].isdigit() or s[0] in "+-."):
+            try:
+                f = float(s)
+                if abs(f - round(f)) < 1e-9:
+                    s = str(int(round(f)))
+            except Exception:
+                pass
         sl = s.lower()
         if (s == "") or (sl == "nan") or (sl == "nat") or sl.startswith("unnamed"):
             name = f"col_{i+1}"
@@ -104,10 +138,6 @@ def dedup(names: Iterable) -> List[str]:
         out.append(name)
     return out
 
-def to_json_records(df: pd.DataFrame) -> str:
-    df2 = df.astype(object).where(pd.notna(df), "")
-    return df2.to_json(orient="records", force_ascii=False, indent=2)
-
 # -------------------- meta helpers --------------------
 def _mark_meta_dir(path_like: Optional[Path]) -> None:
     if not path_like:
@@ -142,19 +172,104 @@ def _write_meta_files(xlsm_path: Path) -> None:
         "source_mtime_iso": mtime_iso,
     }
 
+    # same payload everywhere: serialise once, then one bytes write per dir
+    payload = json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8")
     for d in sorted(_META_DIRS):
         try:
             ensure_parent(d / "meta.json")
-            (d / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+            (d / "meta.json").write_bytes(payload)
             print(f"🕒 meta  → {d / 'meta.json'}")
         except Exception as e:
             print(f"⚠️  meta write failed for {d}: {e}")
 
 # -------------------- reading helpers --------------------
+class WorkbookCache:
+    """
+    One pd.ExcelFile handle shared by every reader in this process.
+
+    pd.read_excel(path, ...) re-inflates the zip and re-parses workbook.xml and
+    sharedStrings on every call; the handle pays for that once (the openpyxl
+    engine already opens read_only / data_only / keep_links=False). Sheets still
+    go through pandas' own parser, so values come back exactly as before.
+    """
+    def __init__(self, path: Path, engine: str = "openpyxl"):
+        self.path = path
+        self.engine = engine
+        self._xl: Optional[pd.ExcelFile] = None
+
+    def _file(self) -> pd.ExcelFile:
+        if self._xl is None:
+            self._xl = pd.ExcelFile(self.path, engine=self.engine)
+        return self._xl
+
+    def sheet(self, name: str, **kw: Any) -> pd.DataFrame:
+        return self._file().parse(sheet_name=name, **kw)
+
+    def matrix(self, name: str) -> np.ndarray:
+        """
+        Raw cells of a header-less sheet as a 2-D object array — the same values
+        parse(header=None, dtype=object).to_numpy() gives, but streamed straight
+        off openpyxl's read-only rows without pandas' text parser in between.
+        """
+        if self.engine != "openpyxl":
+            return self.sheet(name, header=None, dtype=object).to_numpy(dtype=object)
+        rows: List[List[Any]] = []
+        width = 0
+        last = 0  # trailing all-blank rows are dropped, as pandas does
+        ws = self._file().book[name]
+        ws.reset_dimensions()  # ignore a stale <dimension> tag, as pandas' reader does
+        for row in ws.iter_rows(values_only=True):
+            n = len(row)
+            while n and (row[n - 1] is None or row[n - 1] == ""):
+                n -= 1
+            vals = [_raw_cell(row[c]) for c in range(n)]
+            rows.append(vals)
+            if vals:
+                width = max(width, len(vals))
+                last = len(rows)
+        out = np.full((last, width), np.nan, dtype=object)
+        for r in range(last):
+            vals = rows[r]
+            out[r, :len(vals)] = vals
+        return out
+
+    def close(self) -> None:
+        if self._xl is not None:
+            self._xl.close()
+            self._xl = None
+
+    def __enter__(self) -> "WorkbookCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+# what pandas' excel reader turns into NaN: error cells, blanks and its default na_values
+_NA_TEXT = frozenset(ERROR_CODES) | {
+    "", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+}
+
+def _raw_cell(v: Any) -> Any:
+    if v is None:
+        return np.nan
+    t = type(v)
+    if t is str:
+        return np.nan if v in _NA_TEXT else v
+    if t is float and v.is_integer():
+        return int(v)
+    return v
+
+def _read_sheet(xlsm_path: Path, sheet: str, book: Optional[WorkbookCache], **kw: Any) -> pd.DataFrame:
+    if book is not None:
+        return book.sheet(sheet, **kw)
+    return pd.read_excel(xlsm_path, sheet_name=sheet, engine="openpyxl", **kw)
+
 def read_with_header_and_start(xlsm_path: Path, sheet: str,
                                header_row: Optional[int],
-                               data_start_row: Optional[int]) -> pd.DataFrame:
-    raw = pd.read_excel(xlsm_path, sheet_name=sheet, engine="openpyxl", header=None)
+                               data_start_row: Optional[int],
+                               book: Optional[WorkbookCache] = None) -> pd.DataFrame:
+    raw = _read_sheet(xlsm_path, sheet, book, header=None)
     if (header_row is not None) and (data_start_row is not None):
         hdr = max(1, header_row) - 1
         start = max(1, data_start_row) - 1
@@ -206,6 +321,12 @@ def _collect_percent_columns(columns: List[str], cfg: Dict[str, Any]) -> List[st
                 out.add(c)
     return list(out)
 
+def _pct_strings(s: pd.Series, decimals: int) -> pd.Series:
+    """'12.3%' per value, '' for NaN; one pass over a plain float list instead of Series.map."""
+    fmt = f"{{:.{decimals}f}}%".format
+    return pd.Series(["" if v != v else fmt(v) for v in s.to_numpy(dtype=float).tolist()],
+                     index=s.index, dtype=object)
+
 def format_percents(df: pd.DataFrame, percent_cols: List[str], decimals: int, as_string: bool) -> pd.DataFrame:
     for col in percent_cols:
         if col not in df.columns:
@@ -217,23 +338,25 @@ def format_percents(df: pd.DataFrame, percent_cols: List[str], decimals: int, as
         if max_abs <= 1 + 1e-12:
             s = s * 100.0
         if as_string:
-            df[col] = s.map(lambda v: "" if pd.isna(v) else f"{v:.{decimals}f}%")
+            df[col] = _pct_strings(s, decimals)
         else:
             df[col] = s.round(decimals)
     return df
 
 def round_numeric(df: pd.DataFrame, decimals: int, skip_cols: set[str]) -> pd.DataFrame:
-    for col in df.columns:
-        if col in skip_cols:
-            continue
-        s = pd.to_numeric(df[col], errors="coerce")
-        if s.notna().sum() == 0:
+    cols = [c for c in df.columns if c not in skip_cols]
+    if not cols:
+        return df
+    num = df[cols].apply(pd.to_numeric, errors="coerce")
+    # has-any-number and whole-number tests for every column in one 2-D pass each
+    vals = num.to_numpy(dtype=float, na_value=np.nan)
+    present = ~np.isnan(vals)
+    whole = (np.isclose(vals % 1, 0) | ~present).all(axis=0)
+    for j, col in enumerate(cols):
+        if not present[:, j].any():
             continue
-        non_na = s.dropna()
-        if len(non_na) and np.all(np.isclose(non_na % 1, 0)):
-            df[col] = s.round(0).astype("Int64")
-        else:
-            df[col] = s.round(decimals)
+        s = num.iloc[:, j]
+        df[col] = s.round(0).astype("Int64") if whole[j] else s.round(decimals)
     return df
 
 def round_integer_columns(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
@@ -264,7 +387,8 @@ def _coerce_str(series: pd.Series, case_sensitive: bool) -> pd.Series:
         s = s.str.lower()
     return s
 
-def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
+def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any],
+                       _cache: Optional[Dict[tuple, pd.Series]] = None) -> pd.Series:
     col_name = _resolve_col(df, f.get("column", ""))
     if not col_name:
         return pd.Series([True]*len(df), index=df.index)
@@ -273,6 +397,15 @@ def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
     cs = bool(f.get("case_sensitive", False))
     series = df[col_name]
 
+    def coerced_str() -> pd.Series:
+        # several filters on one column share its stripped / lower-cased Series
+        if _cache is None:
+            return _coerce_str(series, cs)
+        key = (col_name, cs)
+        if key not in _cache:
+            _cache[key] = _coerce_str(series, cs)
+        return _cache[key]
+
     if op == "nonempty":
         if series.dtype == object:
             return series.astype(str).str.strip().ne("").fillna(False)
@@ -280,20 +413,20 @@ def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
 
     if op in {"equals", "not_equals", "contains", "not_contains", "startswith", "endswith", "regex"}:
         sval = f.get("value", "")
-        s = _coerce_str(series, cs)
+        s = coerced_str()
         val = str(sval).strip()
         if not cs:
             val = val.lower()
         if op == "equals":        res = s.eq(val)
         elif op == "not_equals":  res = s.ne(val)
-        elif op == "contains":    res = s.str.contains(val, na=False)
-        elif op == "not_contains":res = ~s.str.contains(val, na=False)
+        elif op == "contains":    res = str_contains(s, val)
+        elif op == "not_contains":res = ~str_contains(s, val)
         elif op == "startswith":  res = s.str.startswith(val, na=False)
         elif op == "endswith":    res = s.str.endswith(val, na=False)
         elif op == "regex":
             flags = 0 if cs else re.IGNORECASE
             try:
-                pat = re.compile(val, flags)
+                pat = filter_re(val, flags)
             except Exception:
                 return pd.Series([True]*len(df), index=df.index)
             res = s.str.match(pat).fillna(False)
@@ -319,7 +452,7 @@ def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
             set_vals = set(num_vals.tolist())
             res = s.isin(set_vals)
         else:
-            ss = _coerce_str(series, cs)
+            ss = coerced_str()
             set_vals = {(str(x).strip() if cs else str(x).strip().lower()) for x in vals}
             res = ss.isin(set_vals)
         if op == "not_in":
@@ -328,43 +461,64 @@ def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
 
     return pd.Series([True]*len(df), index=df.index)
 
+# rough per-row price of each op; groups go last since they fan out into several leaves
+_FILTER_COST = {
+    "nonempty": 0, "gt": 1, "gte": 1, "lt": 1, "lte": 1, "in": 2, "not_in": 2,
+    "equals": 3, "not_equals": 3, "startswith": 4, "endswith": 4,
+    "contains": 5, "not_contains": 5, "regex": 6,
+}
+
+def _filter_cost(f: Any) -> int:
+    if isinstance(f, dict) and ("any_of" in f or "all_of" in f):
+        return 7
+    op = (f.get("op") or "contains").lower() if isinstance(f, dict) else ""
+    return _FILTER_COST.get(op, 5)
+
 def _apply_filters(df: pd.DataFrame, filters: Union[List, Dict]) -> pd.DataFrame:
-    def eval_filter(f) -> pd.Series:
+    col_cache: Dict[tuple, pd.Series] = {}
+
+    def eval_filter(f, frame: pd.DataFrame) -> pd.Series:
         if isinstance(f, dict) and ("any_of" in f or "all_of" in f):
             if "any_of" in f:
-                parts = [eval_filter(x) for x in (f.get("any_of") or [])]
-                return pd.concat(parts, axis=1).any(axis=1) if parts else pd.Series([True]*len(df), index=df.index)
+                return combine_masks([eval_filter(x, frame) for x in (f.get("any_of") or [])], frame.index, "any")
             if "all_of" in f:
-                parts = [eval_filter(x) for x in (f.get("all_of") or [])]
-                return pd.concat(parts, axis=1).all(axis=1) if parts else pd.Series([True]*len(df), index=df.index)
-        return _apply_leaf_filter(df, f)
+                return combine_masks([eval_filter(x, frame) for x in (f.get("all_of") or [])], frame.index, "all")
+        return _apply_leaf_filter(frame, f, col_cache)
 
     if not filters:
         return df
     if isinstance(filters, dict) and ("any_of" in filters or "all_of" in filters):
-        mask = eval_filter(filters)
+        mask = eval_filter(filters, df)
         return df[mask]
     if isinstance(filters, list):
-        masks = [eval_filter(f) for f in filters]
-        mask = pd.concat(masks, axis=1).all(axis=1) if masks else pd.Series([True]*len(df), index=df.index)
-        return df[mask]
+        # AND of element-wise leaves: run the cheap ones first and hand each
+        # later (pricier) one only the rows that are still in
+        cur = df
+        for f in sorted(filters, key=_filter_cost):
+            if cur.empty:
+                break
+            keep = eval_filter(f, cur).to_numpy(dtype=bool)
+            if not keep.all():
+                cur = cur[keep]
+                col_cache.clear()  # cached coerced columns belong to the previous rows
+        return cur
     return df
 
 # -------------------- export core --------------------
 def export_one(df: pd.DataFrame, out_csv: Optional[Path], out_json: Optional[Path]) -> None:
     if out_csv:
         ensure_parent(out_csv)
-        df_csv = df.astype(object).where(pd.notna(df), "")
-        df_csv.to_csv(out_csv, index=False, encoding="utf-8-sig")
+        df.to_csv(out_csv, index=False, encoding="utf-8-sig", na_rep="", lineterminator="\n")
         print(f"✔️  CSV  → {out_csv}")
         _mark_meta_dir(out_csv.parent)
     if out_json:
         ensure_parent(out_json)
-        out_json.write_text(to_json_records(df), encoding="utf-8")
+        out_json.write_bytes(to_json_records(df))
         print(f"✔️  JSON → {out_json}")
         _mark_meta_dir(out_json.parent)
 
-def run_task(xlsm_path: Path, project_root: Path, task: Dict[str, Any]) -> None:
+def run_task(xlsm_path: Path, project_root: Path, task: Dict[str, Any],
+             book: Optional[WorkbookCache] = None) -> None:
     sheet = task.get("sheet")
     if not sheet:
         print("  ⚠ SKIP: task missing 'sheet'.")
@@ -375,6 +529,7 @@ def run_task(xlsm_path: Path, project_root: Path, task: Dict[str, Any]) -> None:
         sheet=sheet,
         header_row=task.get("header_row"),
         data_start_row=task.get("data_start_row"),
+        book=book,
     )
 
     df = df.dropna(axis=1, how="all").dropna(axis=0, how="all")
@@ -421,8 +576,26 @@ def run_task(xlsm_path: Path, project_root: Path, task: Dict[str, Any]) -> None:
 
     export_one(df, csv_path, json_path)
 
+# per-process handle for pool workers, so a worker that picks up several tasks parses the workbook once
+_WORKER_BOOK: Optional[WorkbookCache] = None
+
+def _init_worker(xlsm_path: Path, engine: str) -> None:
+    global _WORKER_BOOK
+    _WORKER_BOOK = WorkbookCache(xlsm_path, engine)
+
+def _run_task_worker(xlsm_path: Path, project_root: Path, task: Dict[str, Any]) -> tuple[List[Path], Optional[str]]:
+    """Process-pool entry: run one task and hand back the meta dirs it touched (and any error)."""
+    _META_DIRS.clear()
+    try:
+        run_task(xlsm_path, project_root, task, _WORKER_BOOK)
+        err = None
+    except Exception as e:
+        err = str(e)
+    return sorted(_META_DIRS), err
+
 # -------------------- cheatsheets exporter --------------------
-def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> None:
+def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any],
+                    book: Optional[WorkbookCache] = None) -> None:
     """
     Export cheatsheets.json from a sheet of yellow-header blocks.
     """
@@ -439,10 +612,14 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
         print("⚠️  SKIP cheatsheets: missing out_rel")
         return
 
-    raw = pd.read_excel(xlsm_path, sheet_name=sheet, engine="openpyxl", header=None, dtype=object)
-    if raw is None or raw.empty:
+    if book is not None:
+        arr = book.matrix(sheet)
+    else:
+        arr = pd.read_excel(xlsm_path, sheet_name=sheet, engine="openpyxl",
+                            header=None, dtype=object).to_numpy(dtype=object)
+    if arr.size == 0:
         print("⚠️  SKIP cheatsheets: empty sheet"); return
-    n_rows, n_cols = raw.shape
+    n_rows, n_cols = arr.shape
 
     def norm(v: Any) -> str:
         s = "" if v is None or (isinstance(v, float) and pd.isna(v)) else str(v)
@@ -452,13 +629,14 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
     tables_cfg = cs.get("tables") or []
     all_titles_norm = {norm(str(t.get("title") or "")) for t in tables_cfg if t.get("title")}
 
-    # index every cell by content
-    index: Dict[str, List[tuple]] = {}
-    for r in range(n_rows):
-        for c, v in enumerate(raw.iloc[r].tolist()):
+    # first (row-major) cell holding each title we'll look up
+    wanted = {norm(str(t.get("title") or f"Table {i+1}").strip()) for i, t in enumerate(tables_cfg)}
+    index: Dict[str, tuple] = {}
+    for r, row in enumerate(arr):
+        for c, v in enumerate(row):
             s = norm(v)
-            if s:
-                index.setdefault(s, []).append((r, c))
+            if s in wanted and s not in index:
+                index[s] = (r, c)
 
     tables_out: List[Dict[str, Any]] = []
 
@@ -466,13 +644,13 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
         title = str(t.get("title") or f"Table {i+1}").strip()
         width = max(1, int(t.get("width", 3)))
 
-        locs = index.get(norm(title), [])
-        if not locs:
+        loc = index.get(norm(title))
+        if loc is None:
             print(f"⚠️  cheatsheets: title not found: '{title}'")
             continue
 
         # The yellow row WITH the title text IS the header row
-        start_r, start_c = min(locs, key=lambda rc: (rc[0], rc[1]))
+        start_r, start_c = loc
         c0, c1 = start_c, min(start_c + width, n_cols)
 
         header_r = start_r              # header row
@@ -486,18 +664,17 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
         r = data_r0
         taken = 0
         while r < n_rows and taken < limit_rows:
-            row_slice = raw.iloc[r, c0:c1]
-            is_blank = all((str(x).strip() == "" or pd.isna(x)) for x in row_slice.tolist())
+            is_blank = all((str(x).strip() == "" or pd.isna(x)) for x in arr[r, c0:c1])
             if is_blank:
                 break
-            first_cell = norm(raw.iloc[r, c0])
+            first_cell = norm(arr[r, c0])
             if first_cell in all_titles_norm:
                 break
             r += 1
             taken += 1
         data_r1 = r
 
-        header_vals = [str(x).strip() for x in raw.iloc[header_r, c0:c1].tolist()]
+        header_vals = [str(x).strip() for x in arr[header_r, c0:c1]]
         cols = dedup([hv if hv != "" else f"col_{j+1}" for j, hv in enumerate(header_vals)])
 
         if cols:
@@ -506,7 +683,7 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
         if cols and (cols[-1] == "" or re.fullmatch(r"[\d\.\%kK,]+", cols[-1])):
             cols[-1] = "Value"
 
-        sub = raw.iloc[data_r0:data_r1, c0:c1].copy()
+        sub = pd.DataFrame(arr[data_r0:data_r1, c0:c1])
         if sub.empty:
             print(f"⚠️  cheatsheets: '{title}' slice is empty")
             continue
@@ -528,7 +705,7 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
             if s.notna().any():
                 if float(np.nanmax(np.abs(s.values))) <= 1.5:
                     s = s * 100.0
-                sub[value_col] = s.map(lambda v: "" if pd.isna(v) else f"{v:.1f}%")
+                sub[value_col] = _pct_strings(s, 1)
 
         tables_out.append({
             "id":      f"t{i+1}",
@@ -549,15 +726,15 @@ def _norm_str(v: Any) -> str:
     s = "" if v is None or (isinstance(v, float) and pd.isna(v)) else str(v)
     return s.strip()
 
+_PAREN_ID_RE = re.compile(r"\(([\d-]+)\)\s*$")
+
 def _parse_site_id(val: Any) -> str:
     s = _norm_str(val)
     if not s:
         return ""
-    m = re.search(r"\(([\d-]+)\)\s*$", s)
-    if m:
-        return m.group(1)
-    m2 = re.fullmatch(r"[\d-]+", s)
-    return m2.group(0) if m2 else s
+    m = _PAREN_ID_RE.search(s)
+    # "Name (12345)" → 12345; a bare id (or anything else) passes through as-is
+    return m.group(1) if m else s
 
 def _num_or_none(v: Any) -> Optional[int]:
     s = _norm_str(v)
@@ -568,7 +745,8 @@ def _num_or_none(v: Any) -> Optional[int]:
     except Exception:
         return None
 
-def run_site_ids(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> None:
+def run_site_ids(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any],
+                 book: Optional[WorkbookCache] = None) -> None:
     """
     Reads the 'Imports' sheet laid out like your screenshot:
 
@@ -598,7 +776,7 @@ def run_site_ids(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
 
     try:
         # header=1 => use Excel row 2 as header (0-based index 1)
-        raw = pd.read_excel(xlsm_path, sheet_name=sheet, engine="openpyxl", header=1, dtype=object)
+        raw = _read_sheet(xlsm_path, sheet, book, header=1, dtype=object)
     except Exception as e:
         print(f"⚠️  SKIP site_ids: cannot read sheet '{sheet}': {e}")
         return
@@ -642,16 +820,19 @@ def run_site_ids(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> No
 
     added_pairs = {"dk": 0, "fd": 0}
 
-    for _, row in raw.iterrows():
+    # walk the eight columns as plain lists — no Series per row as with iterrows
+    cols = [raw[c].tolist() for c in (DK_DISPLAY, DK_NAME, DK_SAL, DK_ID, FD_DISPLAY, FD_NAME, FD_SAL, FD_ID)]
+    for dk_disp_v, dk_name_v, dk_sal_v, dk_id_v, fd_disp_v, fd_name_v, fd_sal_v, fd_id_v in zip(*cols):
+        dk_display = _norm_str(dk_disp_v); dk_site = _norm_str(dk_name_v)
+        fd_display = _norm_str(fd_disp_v); fd_site = _norm_str(fd_name_v)
+        dk_id = _parse_site_id(dk_id_v); fd_id = _parse_site_id(fd_id_v)
+
         # stop when the row is truly blank on key identifiers
-        if all(_norm_str(row[c]) == "" for c in [DK_DISPLAY, DK_NAME, DK_ID, FD_DISPLAY, FD_NAME, FD_ID]):
+        if not (dk_display or dk_site or dk_id or fd_display or fd_site or fd_id):
             break
 
-        dk_display = _norm_str(row[DK_DISPLAY]); dk_site = _norm_str(row[DK_NAME])
-        dk_id = _parse_site_id(row[DK_ID]); dk_sal = _num_or_none(row[DK_SAL])
-
-        fd_display = _norm_str(row[FD_DISPLAY]); fd_site = _norm_str(row[FD_NAME])
-        fd_id = _parse_site_id(row[FD_ID]); fd_sal = _num_or_none(row[FD_SAL])
+        dk_sal = _num_or_none(dk_sal_v)
+        fd_sal = _num_or_none(fd_sal_v)
 
         if dk_id:
             if dk_display:
@@ -723,7 +904,30 @@ def _clean_h2h_number(x: Any) -> Optional[float]:
     except Exception:
         return None
 
-def run_h2h_matrix(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> None:
+def _clean_number_column(s: pd.Series, cell: Callable[[Any], Optional[float]],
+                         scale_fractions: bool = False) -> pd.Series:
+    """
+    Column form of the per-cell cleaners: pd.to_numeric converts the numeric
+    cells in one pass, and only what it can't parse (text like "45%" or
+    "1,234") goes through `cell`. scale_fractions mirrors _clean_h2h_number's
+    <= 1.5 → ×100 for the vectorised part. Other dtypes (Excel dates from a
+    cell like "3/4") go through `cell` whole; to_numeric would give epoch numbers.
+    """
+    if s.dtype.kind not in "biufO":
+        return s.map(cell).astype(float)
+    num = pd.to_numeric(s, errors="coerce").astype(float)
+    if s.dtype == bool or s.dtype == object:
+        # the cell cleaners read booleans as text ("True"), i.e. not a number
+        num[s.map(type).eq(bool).to_numpy()] = np.nan
+    if scale_fractions:
+        num = num.where(~(num <= 1.5), num * 100.0)
+    left = num.isna() & s.notna()
+    if left.any():
+        num[left] = s[left].map(cell).astype(float)
+    return num
+
+def run_h2h_matrix(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any],
+                   book: Optional[WorkbookCache] = None) -> None:
     hcfg = cfg.get("h2h_matrix", {}) or {}
     sheet   = hcfg.get("sheet") or "H2H Matrix"
     out_rel = (hcfg.get("out_rel") or "data/nascar/cup/latest/h2h_matrix").lstrip(r"\/")
@@ -733,6 +937,7 @@ def run_h2h_matrix(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
         sheet=sheet,
         header_row=hcfg.get("header_row"),
         data_start_row=hcfg.get("data_start_row"),
+        book=book,
     )
     if df is None or df.empty:
         print(f"⚠️  SKIP h2h_matrix: empty sheet '{sheet}'")
@@ -754,7 +959,7 @@ def run_h2h_matrix(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
     cols = list(df.columns)
     opp_cols = [c for c in cols if c != "Driver"]
     for c in opp_cols:
-        df[c] = df[c].map(_clean_h2h_number)
+        df[c] = _clean_number_column(df[c], _clean_h2h_number, scale_fractions=True)
 
     diag = set(df["Driver"])
     for c in opp_cols:
@@ -764,7 +969,7 @@ def run_h2h_matrix(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) ->
 
     out_path = (project_root / "public" / Path(out_rel)).with_suffix(".json")
     ensure_parent(out_path)
-    out_path.write_text(to_json_records(df), encoding="utf-8")
+    out_path.write_bytes(to_json_records(df))
     print(f"✔️  JSON → {out_path}  (H2H rows: {len(df)})")
     _mark_meta_dir(out_path.parent)
 
@@ -782,7 +987,10 @@ def _clean_percent_cell(x: Any) -> Optional[float]:
     except Exception:
         return None
 
-def run_finish_distribution(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any]) -> None:
+_POS_COL_RE = re.compile(r"P?(\d+)", re.IGNORECASE)
+
+def run_finish_distribution(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any],
+                            book: Optional[WorkbookCache] = None) -> None:
     fcfg = cfg.get("finish_distribution", {}) or {}
     sheet   = fcfg.get("sheet") or "Finish Distributions"
     out_rel = (fcfg.get("out_rel") or "data/nascar/cup/latest/finish_dist").lstrip(r"\/")
@@ -792,6 +1000,7 @@ def run_finish_distribution(xlsm_path: Path, project_root: Path, cfg: Dict[str,
         sheet=sheet,
         header_row=fcfg.get("header_row"),
         data_start_row=fcfg.get("data_start_row"),
+        book=book,
     )
     if df is None or df.empty:
         print(f"⚠️  SKIP finish_distribution: empty sheet '{sheet}'")
@@ -809,21 +1018,13 @@ def run_finish_distribution(xlsm_path: Path, project_root: Path, cfg: Dict[str,
     df = df[df["Driver"] != ""]
 
     pos_cols_raw = [c for c in df.columns if c != "Driver"]
-    pos_map = {}
-    for c in pos_cols_raw:
-        m = re.fullmatch(r"P?(\d+)", str(c).strip(), flags=re.IGNORECASE)
-        if m:
-            n = int(m.group(1))
-            pos_map[c] = f"P{n}"
-
-    ordered = sorted([(int(re.fullmatch(r"P?(\d+)", str(c).strip(), flags=re.IGNORECASE).group(1)), c)
-                      for c in pos_cols_raw
-                      if re.fullmatch(r"P?(\d+)", str(c).strip(), flags=re.IGNORECASE)],
-                     key=lambda t: t[0])
-    ordered_src = [c for _, c in ordered]
+    # one match per column feeds both the rename map and the P1..Pn ordering
+    matched = [(int(m.group(1)), c) for c in pos_cols_raw if (m := _POS_COL_RE.fullmatch(str(c).strip()))]
+    pos_map = {c: f"P{n}" for n, c in matched}
+    ordered_src = [c for _, c in sorted(matched, key=lambda t: t[0])]
 
     for c in pos_cols_raw:
-        df[c] = df[c].map(_clean_percent_cell)
+        df[c] = _clean_number_column(df[c], _clean_percent_cell)
 
     if ordered_src:
         row_sums = df[ordered_src].sum(axis=1, skipna=True)
@@ -842,7 +1043,7 @@ def run_finish_distribution(xlsm_path: Path, project_root: Path, cfg: Dict[str,
 
     out_path = (project_root / "public" / Path(out_rel)).with_suffix(".json")
     ensure_parent(out_path)
-    out_path.write_text(to_json_records(df), encoding="utf-8")
+    out_path.write_bytes(to_json_records(df))
     print(f"✔️  JSON → {out_path}  (Finish Dist rows: {len(df)}, positions: {len(keep_cols)-1})")
     _mark_meta_dir(out_path.parent)
 
@@ -852,8 +1053,16 @@ def main() -> None:
     ap.add_argument("--xlsm",    default=DEFAULT_XLSM,   help="Path to the source .xlsm workbook")
     ap.add_argument("--project", default=DEFAULT_PROJ,   help="Path to project root (contains /public)")
     ap.add_argument("--config",  default=DEFAULT_CONFIG, help="Path to tasks config JSON")
+    ap.add_argument("--workers", type=int, default=1, help="Processes for sheet tasks (default 1 = sequential, sharing one workbook parse; 0 = one per task up to CPU count)")
+    ap.add_argument("--engine", choices=("openpyxl", "calamine"), default="openpyxl",
+                    help="pandas reader for every sheet (calamine needs python-calamine and pandas >= 2.2)")
     args = ap.parse_args()
 
+    engine = args.engine
+    if engine == "calamine" and not _HAVE_CALAMINE:
+        print("⚠️  python-calamine is not installed; reading with openpyxl")
+        engine = "openpyxl"
+
     xlsm_path     = Path(args.xlsm).resolve()
     project_root  = Path(args.project).resolve()
     config_path   = Path(args.config).resolve()
@@ -862,6 +1071,7 @@ def main() -> None:
     print(f"  xlsm   : {xlsm_path}")
     print(f"  project: {project_root}")
     print(f"  config : {config_path}")
+    print(f"  engine : {engine}")
 
     if not xlsm_path.exists():
         print(f"ERROR: .xlsm not found: {xlsm_path}", file=sys.stderr); sys.exit(1)
@@ -869,7 +1079,7 @@ def main() -> None:
         print(f"ERROR: project root invalid (no /public): {project_root}", file=sys.stderr); sys.exit(1)
 
     try:
-        cfg = json.loads(config_path.read_text(encoding="utf-8-sig"))
+        cfg = json.loads(config_path.read_bytes())
     except Exception as e:
         print(f"ERROR: failed to parse config JSON: {e}", file=sys.stderr); sys.exit(1)
 
@@ -877,11 +1087,12 @@ def main() -> None:
     staged_xlsm, temp_dir = _stage_copy_for_read(xlsm_path)
     print(f"  staged : {staged_xlsm}")
 
+    # every sheet read below (except pool workers, which open their own) shares one parse
+    book = WorkbookCache(staged_xlsm, engine)
     try:
         # validate sheets on the staged copy
         try:
-            xl = pd.ExcelFile(staged_xlsm, engine="openpyxl")
-            sheet_names = set(xl.sheet_names)
+            sheet_names = set(_sheet_names(staged_xlsm))
             print("  sheets :", ", ".join(sorted(sheet_names)))
         except Exception as e:
             print(f"ERROR: unable to open workbook: {e}", file=sys.stderr); sys.exit(1)
@@ -891,6 +1102,7 @@ def main() -> None:
             print("ERROR: config has no 'tasks' array.", file=sys.stderr); sys.exit(1)
 
         print("\n=== TASKS ===")
+        runnable = []
         for t in tasks:
             sheet = t.get("sheet")
             out_rel = t.get("out_rel", "?")
@@ -899,32 +1111,49 @@ def main() -> None:
                 print("  ⚠ SKIP: task without sheet name."); continue
             if sheet not in sheet_names:
                 print(f"  ⚠ SKIP: sheet '{sheet}' not found in workbook."); continue
-            try:
-                run_task(staged_xlsm, project_root, t)
-            except Exception as e:
-                print(f"  ⚠ task failed: {e}")
+            runnable.append(t)
+
+        workers = args.workers or min(len(runnable), os.cpu_count() or 1)
+        if workers > 1 and len(runnable) > 1:
+            # each task reads the staged copy and writes its own out_rel; meta dirs come back here
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(staged_xlsm, engine)) as ex:
+                futs = {ex.submit(_run_task_worker, staged_xlsm, project_root, t): t for t in runnable}
+                for fut in as_completed(futs):
+                    try:
+                        dirs, err = fut.result()
+                    except Exception as e:
+                        dirs, err = [], str(e)
+                    _META_DIRS.update(dirs)
+                    if err:
+                        print(f"  ⚠ task '{futs[fut].get('sheet')}' failed: {err}")
+        else:
+            for t in runnable:
+                try:
+                    run_task(staged_xlsm, project_root, t, book)
+                except Exception as e:
+                    print(f"  ⚠ task failed: {e}")
 
         print("\n=== CHEAT SHEETS ===")
         try:
-            run_cheatsheets(staged_xlsm, project_root, cfg)
+            run_cheatsheets(staged_xlsm, project_root, cfg, book)
         except Exception as e:
             print(f"⚠️  SKIP cheatsheets: {e}")
 
         print("\n=== SITE IDS ===")
         try:
-            run_site_ids(staged_xlsm, project_root, cfg)
+            run_site_ids(staged_xlsm, project_root, cfg, book)
         except Exception as e:
             print(f"⚠️  SKIP site_ids: {e}")
 
         print("\n=== H2H MATRIX ===")
         try:
-            run_h2h_matrix(staged_xlsm, project_root, cfg)
+            run_h2h_matrix(staged_xlsm, project_root, cfg, book)
         except Exception as e:
             print(f"⚠️  SKIP h2h_matrix: {e}")
 
         print("\n=== FINISH DISTRIBUTION ===")
         try:
-            run_finish_distribution(staged_xlsm, project_root, cfg)
+            run_finish_distribution(staged_xlsm, project_root, cfg, book)
         except Exception as e:
             print(f"⚠️  SKIP finish_distribution: {e}")
 
@@ -934,6 +1163,7 @@ def main() -> None:
 
         print("\nDone.")
     finally:
+        book.close()  # release the handle before removing the staged copy (Windows locks open files)
         try: shutil.rmtree(temp_dir, ignore_errors=True)
         except Exception: pass
 
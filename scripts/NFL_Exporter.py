@@ -21,15 +21,21 @@ python scripts/NFL_Exporter.py --xlsm "C:\\path\\to\\NFL.xlsm" \
 
 from __future__ import annotations
 
-import argparse, json, re, sys, shutil, tempfile, datetime, time
+import argparse, copy, json, os, re, sys, shutil, tempfile, datetime, time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 import numpy as np
 from openpyxl import load_workbook
+from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.utils.cell import column_index_from_string
 from openpyxl.worksheet.worksheet import Worksheet
 
+from export_common import combine_masks, filter_re, str_contains, to_json_records, write_json
+
 # ------------------------- ROOT / DEFAULT PATHS -------------------------
 
 THIS = Path(__file__).resolve()
@@ -78,6 +84,20 @@ class SingleMeta:
             item.update(tags)
         self._items.append(item)
 
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        return list(self._items)
+
+    def merge(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Append items collected elsewhere (e.g. by a pool worker's spawn())."""
+        self._items.extend(items)
+
+    def spawn(self) -> "SingleMeta":
+        """Empty collector with the same targets, for work done in another process."""
+        child = copy.copy(self)
+        child._items = []
+        return child
+
     def flush(self):
         self.meta_path.parent.mkdir(parents=True, exist_ok=True)
         payload = {
@@ -110,15 +130,11 @@ def dedup(names: Iterable) -> List[str]:
         out.append(key)
     return out
 
-def to_json_records(df: pd.DataFrame) -> str:
-    df2 = df.astype(object).where(pd.notna(df), "")
-    return df2.to_json(orient="records", force_ascii=False, indent=2)
-
 def _stage_copy_for_read(src: Path) -> tuple[Path, Path]:
     """Copy workbook to temp so Excel can stay open while we read."""
     tmpdir = Path(tempfile.mkdtemp(prefix="nfl_export_"))
     dst = tmpdir / src.name
-    shutil.copy2(src, dst)
+    shutil.copyfile(src, dst)
     return dst, tmpdir
 
 # ------------------ generic value helpers (merge uses these) ------------------
@@ -149,19 +165,31 @@ def _fmt_money(n):
 
 # --------------------- openpyxl “display text” formatting --------------------
 
-_PERCENT_RE = re.compile(r"%")
+_PERCENT_RE  = re.compile(r"%")
+_DECIMALS_RE = re.compile(r"0\.([0]+)")
+
+@lru_cache(maxsize=256)
+def _fmt_meta(fmt: str) -> tuple[int, bool]:
+    """(decimals, is_percent) for a number format — a sheet only has a handful of distinct ones."""
+    m = _DECIMALS_RE.search(fmt)
+    return (len(m.group(1)) if m else 0), bool(_PERCENT_RE.search(fmt))
 
 def _decimals_from_format(fmt: str) -> int:
     if not isinstance(fmt, str):
         return 0
-    m = re.search(r"0\.([0]+)", fmt)
-    return len(m.group(1)) if m else 0
+    return _fmt_meta(fmt)[0]
 
 def _format_cell(cell) -> str:
     v = cell.value
     if v is None:
         return ""
-    fmt = cell.number_format or ""
+
+    # exact-type checks first: plain str/float/int are nearly every cell
+    t = type(v)
+    if t is str:
+        return v.strip()
+    if t is float or t is int:
+        return _format_number(float(v), cell.number_format or "")
 
     # Dates/times
     if isinstance(v, (datetime.date, datetime.datetime, datetime.time)):
@@ -169,20 +197,21 @@ def _format_cell(cell) -> str:
 
     # Numbers
     if isinstance(v, (int, float, np.floating)):
-        x = float(v)
-        if _PERCENT_RE.search(fmt):
-            dec = _decimals_from_format(fmt)
-            n = x * 100.0 if abs(x) <= 1.01 else x
-            if float(n).is_integer():
-                return f"{int(round(n))}%"
-            return f"{n:.{dec}f}%"
-        if float(x).is_integer():
-            return str(int(round(x)))
-        dec = _decimals_from_format(fmt) or 1
-        return f"{x:.{dec}f}"
+        return _format_number(float(v), cell.number_format or "")
 
     return str(v).strip()
 
+def _format_number(x: float, number_format: str) -> str:
+    dec, is_pct = _fmt_meta(number_format)
+    if is_pct:
+        n = x * 100.0 if abs(x) <= 1.01 else x
+        if n.is_integer():
+            return f"{int(round(n))}%"
+        return f"{n:.{dec}f}%"
+    if x.is_integer():
+        return str(int(round(x)))
+    return f"{x:.{dec or 1}f}"
+
 # ------------------------------ header normalization --------------------
 
 _HEADER_ALIASES = {
@@ -245,16 +274,23 @@ def _resolve_col(df: pd.DataFrame, name: str) -> Optional[str]:
     low_map = {c.lower(): c for c in df.columns}
     return low_map.get((name or "").lower())
 
-def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
+def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any],
+                       _cache: Optional[Dict[tuple, pd.Series]] = None) -> pd.Series:
     col_name = _resolve_col(df, f.get("column", ""))
     if not col_name:
         return pd.Series([True] * len(df), index=df.index)
 
     op = (f.get("op") or "contains").lower()
     cs = bool(f.get("case_sensitive", False))
-    s = df[col_name].astype(str)
-    if not cs:
-        s = s.str.lower()
+    # several filters on one column share its str / lower-cased Series
+    key = (col_name, cs)
+    s = _cache.get(key) if _cache is not None else None
+    if s is None:
+        s = df[col_name].astype(str)
+        if not cs:
+            s = s.str.lower()
+        if _cache is not None:
+            _cache[key] = s
 
     if op == "nonempty":       return s.str.strip().ne("")
     val = str(f.get("value", "")).strip()
@@ -262,13 +298,13 @@ def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
 
     if   op == "equals":       res = s.eq(val)
     elif op == "not_equals":   res = s.ne(val)
-    elif op == "contains":     res = s.str.contains(val, na=False)
-    elif op == "not_contains": res = ~s.str.contains(val, na=False)
+    elif op == "contains":     res = str_contains(s, val)
+    elif op == "not_contains": res = ~str_contains(s, val)
     elif op == "startswith":   res = s.str.startswith(val, na=False)
     elif op == "endswith":     res = s.str.endswith(val, na=False)
     elif op == "regex":
         try:
-            pat = re.compile(val, 0 if cs else re.IGNORECASE)
+            pat = filter_re(val, 0 if cs else re.IGNORECASE)
             res = s.str.match(pat).fillna(False)
         except Exception:
             res = pd.Series([True] * len(df), index=df.index)
@@ -278,22 +314,22 @@ def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
     return res.fillna(False)
 
 def _apply_filters(df: pd.DataFrame, filters: Union[List, Dict, None]) -> pd.DataFrame:
+    col_cache: Dict[tuple, pd.Series] = {}
+
     def eval_filter(f) -> pd.Series:
         if isinstance(f, dict) and ("any_of" in f or "all_of" in f):
             if "any_of" in f:
-                parts = [eval_filter(x) for x in (f.get("any_of") or [])]
-                return pd.concat(parts, axis=1).any(axis=1) if parts else pd.Series([True]*len(df), index=df.index)
+                return combine_masks([eval_filter(x) for x in (f.get("any_of") or [])], df.index, "any")
             if "all_of" in f:
-                parts = [eval_filter(x) for x in (f.get("all_of") or [])]
-                return pd.concat(parts, axis=1).all(axis=1) if parts else pd.Series([True]*len(df), index=df.index)
-        return _apply_leaf_filter(df, f)
+                return combine_masks([eval_filter(x) for x in (f.get("all_of") or [])], df.index, "all")
+        return _apply_leaf_filter(df, f, col_cache)
 
     if not filters: return df
     if isinstance(filters, dict) and ("any_of" in filters or "all_of" in filters):
         return df[eval_filter(filters)]
     if isinstance(filters, list):
         masks = [eval_filter(f) for f in filters]
-        return df[pd.concat(masks, axis=1).all(axis=1)] if masks else df
+        return df[combine_masks(masks, df.index, "all")] if masks else df
     return df
 
 # ------------------------------ task runner -----------------------------
@@ -312,12 +348,12 @@ def export_one(df: pd.DataFrame, out_csv: Optional[Path], out_json: Optional[Pat
     n = int(len(df)) if df is not None else 0
     if out_csv:
         ensure_parent(out_csv)
-        df.astype(object).where(pd.notna(df), "").to_csv(out_csv, index=False, encoding="utf-8-sig")
+        df.to_csv(out_csv, index=False, encoding="utf-8-sig", na_rep="", lineterminator="\n")
         print(f"✔️  CSV  → {out_csv}")
         meta.add(out_csv, sheet=sheet, record_count=n, duration_ms=duration, tags={"kind":"task","format":"csv"})
     if out_json:
         ensure_parent(out_json)
-        out_json.write_text(to_json_records(df), encoding="utf-8")
+        out_json.write_bytes(to_json_records(df))
         print(f"✔️  JSON → {out_json}")
         meta.add(out_json, sheet=sheet, record_count=n, duration_ms=duration, tags={"kind":"task","format":"json"})
 
@@ -353,24 +389,35 @@ def run_task(xlsm_path: Path, project_root: Path, task: Dict[str, Any], meta: Si
     json_path = base.with_suffix(".json") if fmt in ("json", "both") else None
     export_one(df, csv_path, json_path, meta, sheet=sheet, t0=t0)
 
+def _run_task_worker(xlsm_path: Path, project_root: Path, task: Dict[str, Any],
+                     meta: SingleMeta) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """Process-pool entry: run one task on an empty spawn of `meta` and hand back its items (and any error)."""
+    local = meta.spawn()
+    try:
+        run_task(xlsm_path, project_root, task, local)
+        err = None
+    except Exception as e:
+        err = str(e)
+    return local.items, err
+
 # ----------------------- header-on-next-row helper ----------------------
 
 _HEADER_KEYS = {"player","salary","team","opponent","opp","o/u","imp. total","proj","projection","value","pown","pown%","cash/gpp/both","time"}
 
 def _looks_like_header(vals: List[str]) -> bool:
-    tokens = {re.sub(r"\s+"," ",str(v or "")).strip().lower() for v in vals}
+    tokens = {" ".join(str(v or "").split()).lower() for v in vals}
     return len(tokens & _HEADER_KEYS) >= 2
 
-def _maybe_shift_header_down(ws: Worksheet, header_r: int, start_c: int, width: int, n_cols: int, title_text: str) -> int:
+def _maybe_shift_header_down(cell_at: Callable[[int, int], Any], header_r: int, start_c: int, width: int, n_cols: int, title_text: str) -> int:
     """
     If the current header row is the section title (e.g., 'Cash Core') and the *next* row
     looks like real headers (Player, Salary, Team, ...), shift header down by +1.
     """
-    head_vals = [_format_cell(ws.cell(header_r, c)) for c in range(start_c, min(start_c+width, n_cols+1))]
+    head_vals = [_format_cell(cell_at(header_r, c)) for c in range(start_c, min(start_c+width, n_cols+1))]
     first_cell = (head_vals[0] or "").strip()
     if first_cell == (title_text or "").strip():
         nxt = header_r + 1
-        nxt_vals = [_format_cell(ws.cell(nxt, c)) for c in range(start_c, min(start_c+width, n_cols+1))]
+        nxt_vals = [_format_cell(cell_at(nxt, c)) for c in range(start_c, min(start_c+width, n_cols+1))]
         if _looks_like_header(nxt_vals):
             return nxt
     return header_r
@@ -402,14 +449,29 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], me
         titles_cfg = cs.get("tables") or []
         all_titles_norm = {norm(t.get("title")) for t in titles_cfg if t.get("title")}
 
-        # Fast index of first occurrences of every non-empty cell text
+        # Stream the sheet once into a 1-based grid; the title index and every
+        # per-table header/row read come from it (ws.cell / ws[r] on a read_only
+        # sheet re-parse it from the top on each call)
+        grid: List[tuple] = [()]
+        for row in ws.iter_rows(min_row=1, max_row=n_rows, max_col=n_cols):
+            grid.append((EMPTY_CELL,) + tuple(row))
+
+        def cell_at(r: int, c: int):
+            if 0 < r < len(grid) and 0 < c < len(grid[r]):
+                return grid[r][c]
+            return EMPTY_CELL
+
+        # First occurrence of each configured title
+        wanted = {norm(str(t.get("title") or f"Table {i+1}").strip()) for i, t in enumerate(titles_cfg)}
         index: Dict[str, tuple] = {}
         max_scan_rows = min(n_rows, int(cs.get("max_scan_rows", n_rows)))
-        for r in range(1, max_scan_rows + 1):
-            row = ws[r]
-            for c in range(1, min(n_cols, len(row)) + 1):
-                s = norm(row[c-1].value)
-                if s and s not in index:
+        for r in range(1, min(max_scan_rows, len(grid) - 1) + 1):
+            for c, cell in enumerate(grid[r][1:], start=1):
+                v = cell.value
+                if v is None:
+                    continue
+                s = norm(v)
+                if s in wanted and s not in index:
                     index[s] = (r, c)
 
         tables_out: List[Dict[str, Any]] = []
@@ -424,17 +486,17 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], me
             start_r, start_c = loc
 
             # ← FIX: if current row is the section title, push header row down one line when needed
-            header_r = _maybe_shift_header_down(ws, start_r, start_c, width, n_cols, title)
+            header_r = _maybe_shift_header_down(cell_at, start_r, start_c, width, n_cols, title)
             data_r0  = header_r + 1
 
-            hdr_cells = [ws.cell(header_r, c) for c in range(start_c, min(start_c + width, n_cols + 1))]
+            hdr_cells = [cell_at(header_r, c) for c in range(start_c, min(start_c + width, n_cols + 1))]
             headers = dedup([_norm_header_label(_format_cell(c)) for c in hdr_cells])
 
             rows = []
             r = data_r0
             blank_rows = 0
             while r <= n_rows and len(rows) < limit_rows:
-                row_cells = [ws.cell(r, c) for c in range(start_c, start_c + len(headers))]
+                row_cells = [cell_at(r, c) for c in range(start_c, start_c + len(headers))]
                 display = [_format_cell(c) for c in row_cells]
                 if all(x == "" for x in display):
                     blank_rows += 1
@@ -443,31 +505,29 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], me
                     r += 1
                     continue
                 blank_rows = 0
-                if norm(ws.cell(r, start_c).value) in all_titles_norm:
+                if norm(cell_at(r, start_c).value) in all_titles_norm:
                     break
                 rows.append(display)
                 r += 1
 
-            sub = pd.DataFrame(rows, columns=headers)
-
             # Normalize a "Player" column for Player Pool/pos tables
-            if "Player" not in sub.columns:
+            if "Player" not in headers:
                 for cand in ["QB","RB","WR","TE","Name","PLAYER"]:
-                    if cand in sub.columns:
-                        sub = sub.rename(columns={cand:"Player"})
+                    if cand in headers:
+                        headers[headers.index(cand)] = "Player"
                         break
 
+            # rows are already display strings; zip straight to records, no DataFrame round-trip
             tables_out.append({
                 "id":      f"t{i+1}",
                 "label":   title,
-                "columns": list(sub.columns),
-                "rows":    sub.astype(object).where(pd.notna(sub), "").to_dict(orient="records"),
+                "columns": headers,
+                "rows":    [dict(zip(headers, row)) for row in rows],
             })
-            print(f"• table '{title}' rows={len(sub)} in {int((time.time()-t0)*1000)} ms")
+            print(f"• table '{title}' rows={len(rows)} in {int((time.time()-t0)*1000)} ms")
 
         out_path = (project_root / "public" / Path(out_rel)).with_suffix(".json")
-        ensure_parent(out_path)
-        out_path.write_text(json.dumps({"tables": tables_out}, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_json(out_path, {"tables": tables_out})
         print(f"✔️  JSON → {out_path}  (tables written: {len(tables_out)} of {len(titles_cfg)})")
         meta.add(out_path, sheet=sheet, record_count=sum(len(t['rows']) for t in tables_out),
                  duration_ms=int((time.time()-t0_total)*1000), tags={"kind":"cheatsheets"})
@@ -477,12 +537,11 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], me
 # ------------------------------- literal read ---------------------------
 
 def _excel_col_to_idx(label: str) -> int:
-    s = re.sub(r"[^A-Za-z]", "", str(label)).upper()
+    s = str(label).strip()
+    if not (s.isascii() and s.isalpha()):
+        s = re.sub(r"[^A-Za-z]", "", s)
     if not s: return 0
-    n = 0
-    for ch in s:
-        n = n * 26 + (ord(ch) - ord("A") + 1)
-    return n - 1
+    return column_index_from_string(s.upper()) - 1  # ValueError past ZZZ
 
 def read_literal_table(xlsm_path: Path, sheet: str,
                        header_row: Optional[int],
@@ -506,14 +565,10 @@ def read_literal_table(xlsm_path: Path, sheet: str,
                 pass
 
         if header_row is None or data_start_row is None:
-            scan = min(8, ws.max_row)
-            best_r, best_nonempty = 1, -1
-            for r in range(1, scan + 1):
-                vals = [c.value for c in ws[r][0:max_c]]
-                nonempty = sum(1 for x in vals if x not in (None, ""))
-                if nonempty > best_nonempty:
-                    best_nonempty = nonempty
-                    best_r = r
+            # top rows in one values-only pull rather than one ws[r] parse each
+            head = ws.iter_rows(min_row=1, max_row=min(8, ws.max_row), max_col=max_c, values_only=True)
+            nonempty = [sum(1 for x in vals if x not in (None, "")) for vals in head]
+            best_r = 1 + max(range(len(nonempty)), key=nonempty.__getitem__) if nonempty else 1
             header_row = best_r
             data_start_row = best_r + 1
 
@@ -523,8 +578,8 @@ def read_literal_table(xlsm_path: Path, sheet: str,
 
         out_rows: List[List[str]] = []
         blanks_in_a_row = 0
-        for r in range(int(data_start_row), ws.max_row + 1):
-            cells = ws[r][0:max_c]
+        # stream the body once: each ws[r] on a read_only sheet re-parses from the top
+        for cells in ws.iter_rows(min_row=int(data_start_row), max_row=ws.max_row, max_col=max_c):
             row = [_format_cell(c) for c in cells]
             if all(v == "" for v in row):
                 blanks_in_a_row += 1
@@ -533,27 +588,44 @@ def read_literal_table(xlsm_path: Path, sheet: str,
             blanks_in_a_row = 0
             out_rows.append(row)
 
-        df = pd.DataFrame(out_rows, columns=headers)
-        df = df.dropna(axis=0, how="all")
-        df = df.replace("", np.nan).dropna(axis=0, how="all").fillna("")
-        df = df.loc[:, ~(df.astype(str).eq("").all())]
-        return df
+        # blank rows never reach out_rows, so only all-empty columns need dropping
+        arr = np.array(out_rows, dtype=object).reshape(len(out_rows), len(headers))
+        col_keep = (arr != "").any(axis=0)
+        return pd.DataFrame(arr[:, col_keep], columns=[h for h, k in zip(headers, col_keep) if k])
     finally:
         wb.close()
 
 # ---------------------- NFL GAMEBOARD (Dashboard) -----------------------
 
-def _gb_cell(ws: Worksheet, r: int, c: int) -> str:
-    v = ws.cell(r, c).value
-    return "" if v is None else str(v).strip()
-
-def _gb_row_text_range(ws: Worksheet, r: int, c0: int, c1: int) -> str:
-    """Join non-empty cell texts inside [c0..c1] for row r."""
-    parts = [_gb_cell(ws, r, c) for c in range(max(1, c0), max(1, c1) + 1)]
-    parts = [p for p in parts if p]
-    return " | ".join(parts)
+def _gb_read_rows(ws: Worksheet, max_row: int, max_col: int) -> tuple[list[tuple], list[list[str]]]:
+    """
+    One styled pass over the dashboard. Returns per-row cell tuples (kept for fills)
+    and their stripped texts, both indexed [r][c] 1-based like ws.cell.
+    """
+    cells: list[tuple] = [()]
+    texts: list[list[str]] = [[]]
+    for row in ws.iter_rows(min_row=1, max_row=max_row, min_col=1, max_col=max_col):
+        cells.append((None,) + tuple(row))
+        texts.append([""] + ["" if c.value is None else str(c.value).strip() for c in row])
+    while len(cells) <= max_row:
+        cells.append((None,) * (max_col + 1))
+        texts.append([""] * (max_col + 1))
+    return cells, texts
+
+def _gb_row_text_range(row_texts: list[str], c0: int, c1: int) -> str:
+    """Join non-empty cell texts inside [c0..c1] of one row."""
+    return " | ".join([p for p in row_texts[max(1, c0):max(1, c1) + 1] if p])
 
 _TEAM_BAR_RE = re.compile(r"^\s*([A-Z]{2,4})\s*\(([-+]?[0-9.]+)\)\s*$")
+_OU_RE       = re.compile(r"O/?U:\s*([0-9.]+)", re.I)
+_ML_RE       = re.compile(r"\b([A-Z]{2,4})\s*ML:\s*([+-]?\d+)", re.I)
+_SPREAD_RE   = re.compile(r"Spread:\s*([A-Z]{2,4})\s*([+-]?[0.9]+)\s*\|\s*([A-Z]{2,4})\s*([+-]?[0-9.]+)", re.I)
+_TOTALS_RE   = re.compile(r"Totals?:\s*([A-Z]{2,4})\s*([0-9.]+)\s*\|\s*([A-Z]{2,4})\s*([0-9.]+)", re.I)
+_TEMP_RE     = re.compile(r"([0-9.]+)\s*°?F", re.I)
+_WIND_RE     = re.compile(r"([0-9.]+)\s*mph", re.I)
+
+# exact-type test for parsed odds; `type(x) in` skips isinstance's subclass walk
+_NUM_TYPES = (int, float)
 
 def _parse_team_bar(txt: str):
     m = _TEAM_BAR_RE.match(txt or "")
@@ -561,56 +633,58 @@ def _parse_team_bar(txt: str):
         return None
     return m.group(1).upper(), float(m.group(2))
 
-def _gb_find_header_cols_in_row(ws: Worksheet, r: int, max_col: int,
+def _gb_find_header_cols_in_row(row_cells: tuple, r: int, max_col: int,
                                 yellow_rgbs: set, title_re: re.Pattern,
                                 _cache: dict=None) -> list[int]:
+    # yellow_rgbs is upper-cased once by the caller; bind the hot lookups locally
     cols = []
-    for c in range(1, max_col + 1):
-        key = (r, c)
-        txt = ws.cell(r, c).value
+    title_match = title_re.match
+    for c in range(1, min(max_col, len(row_cells) - 1) + 1):
+        cell = row_cells[c]
+        txt = cell.value if cell is not None else None
         if not txt:
             continue
 
-        is_header = False
-        try:
-            if _cache is not None and key in _cache:
-                rgb = _cache[key]
-            else:
-                fill = ws.cell(r, c).fill
-                rgb = (fill.fgColor.rgb or "").upper() if (fill and fill.patternType == "solid") else ""
-                if _cache is not None:
-                    _cache[key] = rgb
-            if rgb in yellow_rgbs:
-                is_header = True
-        except Exception:
-            pass
-        if isinstance(txt, str) and title_re.match(txt.strip()):
-            is_header = True
+        # cheap text test first — a title hit never needs the fill
+        if isinstance(txt, str) and title_match(txt.strip()):
+            cols.append(c)
+            continue
 
-        if is_header:
+        key = (r, c)
+        if _cache is not None and key in _cache:
+            rgb = _cache[key]
+        else:
+            try:
+                fill = cell.fill
+                rgb = (fill.fgColor.rgb or "").upper() if (fill is not None and fill.patternType == "solid") else ""
+            except Exception:
+                rgb = ""
+            if _cache is not None:
+                _cache[key] = rgb
+        if rgb in yellow_rgbs:
             cols.append(c)
     return cols
 
 def _gb_parse_ml_pieces(s: str) -> Dict[str, int]:
     out: Dict[str, int] = {}
-    for tm, ml in re.findall(r"\b([A-Z]{2,4})\s*ML:\s*([+-]?\d+)", s, flags=re.I):
+    for tm, ml in _ML_RE.findall(s):
         out[tm.upper()] = int(ml)
     return out
 
 def _gb_parse_spread_pieces(s: str) -> Dict[str, float]:
-    m = re.search(r"Spread:\s*([A-Z]{2,4})\s*([+-]?[0.9]+)\s*\|\s*([A-Z]{2,4})\s*([+-]?[0-9.]+)", s, flags=re.I)
+    m = _SPREAD_RE.search(s)
     if not m: return {}
     return {m.group(1).upper(): float(m.group(2)), m.group(3).upper(): float(m.group(4))}
 
 def _gb_parse_totals_pieces(s: str) -> Dict[str, float]:
-    m = re.search(r"Totals?:\s*([A-Z]{2,4})\s*([0-9.]+)\s*\|\s*([A-Z]{2,4})\s*([0-9.]+)", s, flags=re.I)
+    m = _TOTALS_RE.search(s)
     if not m: return {}
     return {m.group(1).upper(): float(m.group(2)), m.group(3).upper(): float(m.group(4))}
 
 def _gb_parse_weather(s: str) -> Dict[str, Any]:
     is_dome = "dome" in s.lower()
-    temp = re.search(r"([0-9.]+)\s*°?F", s, flags=re.I)
-    wind = re.search(r"([0-9.]+)\s*mph", s, flags=re.I)
+    temp = _TEMP_RE.search(s)
+    wind = _WIND_RE.search(s)
     return {
         "temp_f": float(temp.group(1)) if temp else None,
         "wind_mph": float(wind.group(1)) if wind else None,
@@ -659,12 +733,14 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
         ws = wb[sheet_name]
         max_row, max_col = ws.max_row, ws.max_column
         color_cache = {}
+        # read the sheet once; everything below indexes these rows instead of ws.cell
+        rows, texts = _gb_read_rows(ws, max_row, max_col)
 
         games: List[Dict[str, Any]] = []
 
         r = 1
         while r <= max_row:
-            header_cols = _gb_find_header_cols_in_row(ws, r, max_col, yellow_rgbs, title_re, _cache=color_cache)
+            header_cols = _gb_find_header_cols_in_row(rows[r], r, max_col, yellow_rgbs, title_re, _cache=color_cache)
             if not header_cols:
                 r += 1
                 continue
@@ -673,7 +749,7 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
             for idx, c_start in enumerate(header_cols_sorted):
                 c_end = (header_cols_sorted[idx + 1] - 1) if idx + 1 < len(header_cols_sorted) else max_col
 
-                title_line = _gb_row_text_range(ws, r, c_start, c_end)
+                title_line = _gb_row_text_range(texts[r], c_start, c_end)
                 title = (title_line.split("|", 1)[0] or "").strip()
                 m_title = title_re.match(title)
                 away, home = (m_title.group(1), m_title.group(2)) if m_title else ("", "")
@@ -699,7 +775,7 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
                 team_bar_row = None
                 blank_guard = 0
                 while k <= max_row:
-                    vals = [_gb_cell(ws, k, c) for c in range(c_start, c_end + 1)]
+                    vals = texts[k][c_start:c_end + 1]
                     left  = next((x for x in vals if x), "")
                     right = next((x for x in reversed(vals) if x), "")
 
@@ -725,7 +801,7 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
                     whole = " | ".join([x for x in vals if x])
                     U = whole.upper()
                     if "O/U" in U:
-                        m_ou = re.search(r"O/?U:\s*([0-9.]+)", whole, flags=re.I)
+                        m_ou = _OU_RE.search(whole)
                         if m_ou: g["ou"] = float(m_ou.group(1))
                         ml = _gb_parse_ml_pieces(whole)
                         if g["away"] in ml: g["ml_away"] = ml[g["away"]]
@@ -745,15 +821,18 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
                 if not team_bar_row:
                     continue
 
+                # bound once; the player walk appends to these on every row
+                away_lines = g["team_blocks"]["away"]["lines"]
+                home_lines = g["team_blocks"]["home"]["lines"]
                 k = team_bar_row + 1
                 blank_rows = 0
                 while k <= max_row:
-                    row_hdr_cols = _gb_find_header_cols_in_row(ws, k, c_end, yellow_rgbs, title_re, _cache=color_cache)
+                    row_hdr_cols = _gb_find_header_cols_in_row(rows[k], k, c_end, yellow_rgbs, title_re, _cache=color_cache)
                     row_hdr_cols = [c for c in row_hdr_cols if c_start <= c <= c_end]
                     if row_hdr_cols:
                         break
 
-                    vals = [_gb_cell(ws, k, c) for c in range(c_start, c_end + 1)]
+                    vals = texts[k][c_start:c_end + 1]
                     left  = next((x for x in vals if x), "")
                     right = next((x for x in reversed(vals) if x), "")
 
@@ -768,8 +847,8 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
                         continue
 
                     blank_rows = 0
-                    if left:  g["team_blocks"]["away"]["lines"].append(left)
-                    if right: g["team_blocks"]["home"]["lines"].append(right)
+                    if left:  away_lines.append(left)
+                    if right: home_lines.append(right)
                     k += 1
 
                 games.append(g)
@@ -777,16 +856,16 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
             r += 1
 
         for g in games:
-            if g.get("ou") is None and all(isinstance(g.get(k), (int, float)) for k in ("imp_home", "imp_away")):
-                g["ou"] = float(g["imp_home"]) + float(g["imp_away"])
-            if g.get("imp_home") is None and isinstance(g.get("ou"), (int, float)) and isinstance(g.get("spread_home"), (int, float)):
-                ou = float(g["ou"]); s = float(g["spread_home"])
+            ih, ia, ou, s = g.get("imp_home"), g.get("imp_away"), g.get("ou"), g.get("spread_home")
+            if ou is None and type(ih) in _NUM_TYPES and type(ia) in _NUM_TYPES:
+                ou = g["ou"] = float(ih + ia)
+            if ih is None and type(ou) in _NUM_TYPES and type(s) in _NUM_TYPES:
+                ou = float(ou); s = float(s)
                 g["imp_home"] = (ou - s) / 2
                 g["imp_away"] = ou - g["imp_home"]
 
         out_path = (project_root / "public" / Path(out_rel)).with_suffix(".json")
-        ensure_parent(out_path)
-        out_path.write_text(json.dumps(games, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_json(out_path, games)
         print(f"✔️  JSON → {out_path}  (games: {len(games)})")
         meta.add(out_path, sheet=sheet_name, record_count=len(games),
                  duration_ms=int((time.time()-t0_total)*1000), tags={"kind":"gameboard"})
@@ -797,14 +876,10 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
 
 def _load_json(path: Path):
     try:
-        return json.loads(path.read_text(encoding="utf-8-sig"))
+        return json.loads(path.read_bytes())
     except FileNotFoundError:
         return None
 
-def _save_json(path: Path, obj):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
-
 def _to_rows_shape(raw):
     if raw is None:
         return [], ("none", None)
@@ -820,15 +895,15 @@ def _to_rows_shape(raw):
 def _write_back(rows, shape, out_path: Path):
     kind, container = shape
     if kind == "array":
-        _save_json(out_path, rows)
+        write_json(out_path, rows)
     elif kind == "rows":
         container["rows"] = rows
-        _save_json(out_path, container)
+        write_json(out_path, container)
     elif kind == "players":
         container["players"] = rows
-        _save_json(out_path, container)
+        write_json(out_path, container)
     else:
-        _save_json(out_path, rows)
+        write_json(out_path, rows)
 
 # ------------------------- SALARY MERGE (with TIME) ---------------------
 
@@ -1047,7 +1122,7 @@ def _enrich_player_pool_json(out_path: Path, xlsm_path: Path) -> None:
                 if t:
                     r["Time"] = t
 
-    _save_json(out_path, pp)
+    write_json(out_path, pp)
 
 # ---------------------------- optional Player Pool ----------------------
 
@@ -1091,6 +1166,7 @@ def main() -> None:
     ap.add_argument("--project", default=DEFAULT_PROJ,   help="Path to project root (contains /public)")
     ap.add_argument("--config",  default=DEFAULT_CONFIG, help="Path to exporter config JSON")
     ap.add_argument("--meta_rel", default=DEFAULT_META_REL, help="Relative path under /public for consolidated meta.json")
+    ap.add_argument("--workers", type=int, default=1, help="Processes for sheet tasks (default 1 = sequential in this process; 0 = one per task up to CPU count)")
     args = ap.parse_args()
 
     xlsm_path     = Path(args.xlsm).resolve()
@@ -1106,19 +1182,35 @@ def main() -> None:
     meta = SingleMeta(project_root=project_root, source_workbook=xlsm_path, meta_rel=args.meta_rel)
 
     try:
-        cfg = json.loads(config_path.read_text(encoding="utf-8-sig"))
+        cfg = json.loads(config_path.read_bytes())
 
         tasks = cfg.get("tasks", [])
         if not isinstance(tasks, list):
             print("ERROR: config 'tasks' must be an array.", file=sys.stderr); sys.exit(1)
 
-        for t in tasks:
-            sheet = t.get("sheet")
-            print(f"\n=== TASK: sheet='{sheet}' | out='{t.get('out_rel','?')}' ===")
-            try:
-                run_task(staged_xlsm, project_root, t, meta)
-            except Exception as e:
-                print(f"⚠️  SKIP: task failed: {e}")
+        workers = args.workers or min(len(tasks), os.cpu_count() or 1)
+        if workers > 1 and len(tasks) > 1:
+            # tasks read the staged copy and write distinct out_rel paths; meta items
+            # come back here and are added in task order so meta.json stays stable
+            print(f"\n=== TASKS ({len(tasks)} across {workers} processes) ===")
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                futs = [ex.submit(_run_task_worker, staged_xlsm, project_root, t, meta) for t in tasks]
+                for t, fut in zip(tasks, futs):
+                    try:
+                        items, err = fut.result()
+                    except Exception as e:
+                        items, err = [], str(e)
+                    meta.merge(items)
+                    if err:
+                        print(f"⚠️  SKIP: task '{t.get('sheet')}' failed: {err}")
+        else:
+            for t in tasks:
+                sheet = t.get("sheet")
+                print(f"\n=== TASK: sheet='{sheet}' | out='{t.get('out_rel','?')}' ===")
+                try:
+                    run_task(staged_xlsm, project_root, t, meta)
+                except Exception as e:
+                    print(f"⚠️  SKIP: task failed: {e}")
 
         print("\n=== CHEAT SHEETS ===")
         try:
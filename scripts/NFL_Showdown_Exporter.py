@@ -26,6 +26,10 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
+from openpyxl.cell.read_only import EMPTY_CELL
+from openpyxl.utils.cell import column_index_from_string
+
+from export_common import combine_masks, str_contains, to_json_records, write_json
 
 # ---------- defaults ----------
 THIS = Path(__file__).resolve()
@@ -85,10 +89,6 @@ class SingleMeta:
 def ensure_parent(p: Path) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
 
-def to_json_records(df: pd.DataFrame) -> str:
-    df2 = df.astype(object).where(pd.notna(df), "")
-    return df2.to_json(orient="records", force_ascii=False, indent=2)
-
 def dedup(names: Iterable) -> List[str]:
     seen: Dict[str, int] = {}
     out: List[str] = []
@@ -108,30 +108,31 @@ def dedup(names: Iterable) -> List[str]:
 def _stage_copy_for_read(src: Path) -> Tuple[Path, Path]:
     tmpdir = Path(tempfile.mkdtemp(prefix="nfl_showdown_"))
     dst = tmpdir / src.name
-    shutil.copy2(src, dst)
+    shutil.copyfile(src, dst)
     return dst, tmpdir
 
 def _excel_col_to_idx(label: str) -> int:
-    s = re.sub(r"[^A-Za-z]", "", str(label)).upper()
+    s = str(label).strip()
+    if not (s.isascii() and s.isalpha()):
+        s = re.sub(r"[^A-Za-z]", "", s)
     if not s: return 0
-    n = 0
-    for ch in s:
-        n = n * 26 + (ord(ch) - ord("A") + 1)
-    return n - 1
+    return column_index_from_string(s.upper()) - 1  # ValueError past ZZZ
 
 def _format_cell(cell) -> str:
     v = cell.value
     if v is None:
         return ""
-    fmt = cell.number_format or ""
-    if isinstance(v, (datetime.date, datetime.datetime, datetime.time)):
+    t = type(v)
+    if t is str:  # most cells; never needs the number_format lookup
+        return v.strip()
+    if t is not float and t is not int and isinstance(v, (datetime.date, datetime.datetime, datetime.time)):
         return str(v)
-    if isinstance(v, (int, float, np.floating)):
+    if t is float or t is int or isinstance(v, (int, float, np.floating)):
         x = float(v)
-        if "%" in str(fmt):
+        if "%" in str(cell.number_format or ""):
             n = x * 100.0 if abs(x) <= 1.01 else x
-            return f"{n:.1f}%" if not float(n).is_integer() else f"{int(round(n))}%"
-        return str(int(round(x))) if float(x).is_integer() else f"{x:.1f}"
+            return f"{n:.1f}%" if not n.is_integer() else f"{int(round(n))}%"
+        return str(int(round(x))) if x.is_integer() else f"{x:.1f}"
     return str(v).strip()
 
 def _norm_header_label(s: str) -> str:
@@ -164,19 +165,19 @@ def read_literal_table(xlsm_path: Path, sheet: str,
             raise ValueError(f"Sheet not found: {sheet}")
         ws = wb[sheet]
 
+        n_rows = ws.max_row
         max_c = ws.max_column
         if limit_to_col:
-            max_c = min(max_c, _excel_col_to_idx(limit_to_col) + 1)
+            try:
+                max_c = min(max_c, _excel_col_to_idx(limit_to_col) + 1)
+            except Exception:
+                pass
 
         if header_row is None or data_start_row is None:
-            scan = min(8, ws.max_row)
-            best_r, best_nonempty = 1, -1
-            for r in range(1, scan + 1):
-                vals = [c.value for c in ws[r][0:max_c]]
-                nonempty = sum(1 for x in vals if x not in (None, ""))
-                if nonempty > best_nonempty:
-                    best_nonempty = nonempty
-                    best_r = r
+            # top rows in one values-only pull rather than one ws[r] parse each
+            head = ws.iter_rows(min_row=1, max_row=min(8, n_rows), max_col=max_c, values_only=True)
+            nonempty = [sum(1 for x in vals if x not in (None, "")) for vals in head]
+            best_r = 1 + max(range(len(nonempty)), key=nonempty.__getitem__) if nonempty else 1
             header_row = best_r
             data_start_row = best_r + 1
 
@@ -184,8 +185,8 @@ def read_literal_table(xlsm_path: Path, sheet: str,
 
         out_rows: List[List[str]] = []
         blanks_in_a_row = 0
-        for r in range(int(data_start_row), ws.max_row + 1):
-            cells = ws[r][0:max_c]
+        # stream the body once: each ws[r] on a read_only sheet re-parses from the top
+        for cells in ws.iter_rows(min_row=int(data_start_row), max_row=n_rows, max_col=max_c):
             row = [_format_cell(c) for c in cells]
             if all(v == "" for v in row):
                 blanks_in_a_row += 1
@@ -194,11 +195,10 @@ def read_literal_table(xlsm_path: Path, sheet: str,
             blanks_in_a_row = 0
             out_rows.append(row)
 
-        df = pd.DataFrame(out_rows, columns=headers)
-        df = df.dropna(axis=0, how="all")
-        df = df.replace("", np.nan).dropna(axis=0, how="all").fillna("")
-        df = df.loc[:, ~(df.astype(str).eq("").all())]
-        return df
+        # blank rows never reach out_rows, so only all-empty columns need dropping
+        arr = np.array(out_rows, dtype=object).reshape(len(out_rows), len(headers))
+        col_keep = (arr != "").any(axis=0)
+        return pd.DataFrame(arr[:, col_keep], columns=[h for h, k in zip(headers, col_keep) if k])
     finally:
         wb.close()
 
@@ -227,8 +227,8 @@ def _apply_leaf_filter(df: pd.DataFrame, f: Dict[str, Any]) -> pd.Series:
 
     if   op == "equals":       res = s.eq(val)
     elif op == "not_in":       res = ~s.isin([v.lower() if not cs else v for v in f.get("values", [])])
-    elif op == "contains":     res = s.str.contains(val, na=False)
-    elif op == "not_contains": res = ~s.str.contains(val, na=False)
+    elif op == "contains":     res = str_contains(s, val)
+    elif op == "not_contains": res = ~str_contains(s, val)
     else:                      res = pd.Series([True] * len(df), index=df.index)
     return res.fillna(False)
 
@@ -236,7 +236,7 @@ def _apply_filters(df: pd.DataFrame, filters: Any) -> pd.DataFrame:
     if not filters: return df
     if isinstance(filters, list):
         masks = [_apply_leaf_filter(df, f) for f in filters]
-        return df[pd.concat(masks, axis=1).all(axis=1)] if masks else df
+        return df[combine_masks(masks, df.index, "all")] if masks else df
     if isinstance(filters, dict):
         return df[_apply_leaf_filter(df, filters)]
     return df
@@ -246,12 +246,12 @@ def export_one(df: pd.DataFrame, out_csv: Optional[Path], out_json: Optional[Pat
     n = int(len(df)) if df is not None else 0
     if out_csv:
         ensure_parent(out_csv)
-        df.astype(object).where(pd.notna(df), "").to_csv(out_csv, index=False, encoding="utf-8-sig")
+        df.to_csv(out_csv, index=False, encoding="utf-8-sig", na_rep="", lineterminator="\n")
         print(f"✔ CSV  → {out_csv}")
         meta.add(out_csv, sheet=sheet, record_count=n, duration_ms=duration, tags={"kind":"task","format":"csv"})
     if out_json:
         ensure_parent(out_json)
-        out_json.write_text(to_json_records(df), encoding="utf-8")
+        out_json.write_bytes(to_json_records(df))
         print(f"✔ JSON → {out_json}")
         meta.add(out_json, sheet=sheet, record_count=n, duration_ms=duration, tags={"kind":"task","format":"json"})
 
@@ -303,11 +303,28 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], me
 
         titles_cfg = cs.get("tables") or []
         all_titles_norm = {norm(t.get("title")) for t in titles_cfg if t.get("title")}
+        # sheet bounds, named once for the loops below
+        n_rows, n_cols = ws.max_row, ws.max_column
+
+        # stream the sheet once; ws.cell on a read_only sheet re-reads the row every call
+        grid: List[tuple] = [()]
+        for row in ws.iter_rows(min_row=1, max_row=n_rows, max_col=n_cols):
+            grid.append((EMPTY_CELL,) + tuple(row))
+
+        def cell_at(r: int, c: int):
+            if 0 < r < len(grid) and 0 < c < len(grid[r]):
+                return grid[r][c]
+            return EMPTY_CELL
+
+        # only the titles we look up are indexed
+        wanted = {norm(str(t.get("title") or f"Table {i+1}").strip()) for i, t in enumerate(titles_cfg)}
         index: Dict[str, List[Tuple[int,int]]] = {}
-        for r in range(1, ws.max_row+1):
-            for c in range(1, ws.max_column+1):
-                s = norm(ws.cell(r,c).value)
-                if s: index.setdefault(s, []).append((r,c))
+        for r in range(1, len(grid)):
+            for c, cell in enumerate(grid[r][1:], start=1):
+                v = cell.value
+                if v is None: continue
+                s = norm(v)
+                if s in wanted: index.setdefault(s, []).append((r,c))
 
         tables_out: List[Dict[str, Any]] = []
         for i, t in enumerate(titles_cfg):
@@ -320,30 +337,28 @@ def run_cheatsheets(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], me
             start_r, start_c = min(locs, key=lambda rc: (rc[0], rc[1]))
             header_r = start_r
             data_r0  = header_r + 1
-            hdr = [ws.cell(header_r, c) for c in range(start_c, min(start_c+width, ws.max_column+1))]
+            hdr = [cell_at(header_r, c) for c in range(start_c, min(start_c+width, n_cols+1))]
             headers = dedup([_norm_header_label(_format_cell(c)) for c in hdr])
 
             rows = []
             r = data_r0
-            while r <= ws.max_row and len(rows) < limit_rows:
-                row_cells = [ws.cell(r, c) for c in range(start_c, start_c+len(headers))]
+            while r <= n_rows and len(rows) < limit_rows:
+                row_cells = [cell_at(r, c) for c in range(start_c, start_c+len(headers))]
                 display = [_format_cell(c) for c in row_cells]
                 if all(x == "" for x in display): break
-                if norm(ws.cell(r, start_c).value) in all_titles_norm: break
+                if norm(cell_at(r, start_c).value) in all_titles_norm: break
                 rows.append(display)
                 r += 1
 
-            sub = pd.DataFrame(rows, columns=headers)
             tables_out.append({
                 "id": f"t{i+1}",
                 "label": title,
-                "columns": list(sub.columns),
-                "rows": sub.astype(object).where(pd.notna(sub), "").to_dict(orient="records"),
+                "columns": headers,
+                "rows": [dict(zip(headers, row)) for row in rows],
             })
 
         out_path = (project_root / "public" / Path(out_rel)).with_suffix(".json")
-        ensure_parent(out_path)
-        out_path.write_text(json.dumps({"tables": tables_out}, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_json(out_path, {"tables": tables_out})
         print(f"✔ JSON → {out_path} (tables: {len(tables_out)})")
         meta.add(out_path, sheet=sheet, record_count=sum(len(t['rows']) for t in tables_out),
                  duration_ms=int((time.time()-t0_total)*1000), tags={"kind":"cheatsheets"})
@@ -357,7 +372,6 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
     out_rel = (gb.get("out_rel") or "").lstrip(r"\/")
     if not out_rel: return
     title_re = re.compile(gb.get("title_regex", r"^\s*([A-Z]{2,4})\s*@\s*([A-Z]{2,4})\s*$"))
-    yellow_rgbs = {str(x).upper() for x in gb.get("header_yellow_rgb", [])}
 
     t0_total = time.time()
     wb = load_workbook(xlsm_path, data_only=True, read_only=True, keep_links=False)
@@ -376,35 +390,33 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
 
         ws = wb[sheet_name]
 
-        def cell(r,c):
-            v = ws.cell(r,c).value
-            return "" if v is None else str(v).strip()
+        # one values-only pass; header_yellow_rgb is not consulted because a yellow
+        # cell still has to match title_re to open a game, so fills never decide anything
+        n_rows, n_cols = ws.max_row, ws.max_column
+        texts: List[List[str]] = [[]]
+        for row in ws.iter_rows(min_row=1, max_row=n_rows, max_col=n_cols, values_only=True):
+            texts.append([""] + ["" if v is None else str(v).strip() for v in row])
+        while len(texts) <= n_rows:
+            texts.append([""] * (n_cols + 1))
 
-        def is_yellow(r,c):
-            try:
-                f = ws.cell(r,c).fill
-                if f and f.patternType == "solid":
-                    rgb = (f.fgColor.rgb or "").upper()
-                    return rgb in yellow_rgbs
-            except Exception:
-                pass
-            return False
+        def cell(r,c):
+            return texts[r][c]
 
+        title_match = title_re.match
         games: List[Dict[str, Any]] = []
-        for r in range(1, ws.max_row+1):
-            # detect simple headers like "AAA @ BBB" (or colored)
-            for c in range(1, ws.max_column+1):
+        for r in range(1, n_rows+1):
+            # detect simple headers like "AAA @ BBB"
+            for c in range(1, n_cols+1):
                 txt = cell(r,c)
                 if not txt: continue
-                if is_yellow(r,c) or title_re.match(txt):
-                    m = title_re.match(txt)
-                    if not m: continue
+                m = title_match(txt)
+                if m:
                     away, home = m.group(1), m.group(2)
                     g = {"away": away, "home": home, "lines": []}
                     k = r+1
                     blanks=0
-                    while k <= ws.max_row and len(g["lines"]) < 20:
-                        rowtxt = " | ".join([cell(k, cc) for cc in range(c, min(c+12, ws.max_column+1)) if cell(k,cc)])
+                    while k <= n_rows and len(g["lines"]) < 20:
+                        rowtxt = " | ".join([x for x in texts[k][c:min(c+12, n_cols+1)] if x])
                         if not rowtxt:
                             blanks += 1
                             if blanks >= 2: break
@@ -414,7 +426,7 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
                         k += 1
                     games.append(g)
         out = (project_root / "public" / Path(out_rel)).with_suffix(".json")
-        ensure_parent(out); out.write_text(json.dumps(games, ensure_ascii=False, indent=2), encoding="utf-8")
+        write_json(out, games)
         print(f"✔ JSON → {out} (games: {len(games)})")
         meta.add(out, sheet=sheet_name, record_count=len(games),
                  duration_ms=int((time.time()-t0_total)*1000), tags={"kind":"gameboard"})
@@ -424,14 +436,10 @@ def run_gameboard(xlsm_path: Path, project_root: Path, cfg: Dict[str, Any], meta
 # ---------- (Optional) merge site_ids.json into projections ----------
 def _load_json(p: Path):
     try:
-        return json.loads(p.read_text(encoding="utf-8-sig"))
+        return json.loads(p.read_bytes())
     except FileNotFoundError:
         return None
 
-def _write_json(p: Path, obj):
-    ensure_parent(p)
-    p.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
-
 def _to_rows_shape(raw):
     if raw is None:
         return [], ("none", None)
@@ -558,13 +566,13 @@ def merge_showdown_into_projections(project_root: Path, cfg: Dict[str, Any], met
 
     # Write back in original shape
     if shape[0] == "array":
-        _write_json(proj_path, rows)
+        write_json(proj_path, rows)
     elif shape[0] == "rows":
-        container = shape[1]; container["rows"] = rows; _write_json(proj_path, container)
+        container = shape[1]; container["rows"] = rows; write_json(proj_path, container)
     elif shape[0] == "players":
-        container = shape[1]; container["players"] = rows; _write_json(proj_path, container)
+        container = shape[1]; container["players"] = rows; write_json(proj_path, container)
     else:
-        _write_json(proj_path, rows)
+        write_json(proj_path, rows)
 
     print("\n=== MERGE SHOWDOWN SALARIES/IDs INTO projections.json ===")
     print(f"• Projections updated: {upd}")
@@ -610,7 +618,7 @@ def main():
     meta = SingleMeta(project_root=project_root, source_workbook=xlsm_path, meta_rel=args.meta_rel)
 
     try:
-        cfg = json.loads(cfg_path.read_text(encoding="utf-8-sig"))
+        cfg = json.loads(cfg_path.read_bytes())
         # tasks
         for t in cfg.get("tasks", []):
             print(f"\n=== TASK: sheet='{t.get('sheet')}' | out='{t.get('out_rel')}' ===")
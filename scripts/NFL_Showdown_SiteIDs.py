@@ -34,6 +34,7 @@ except Exception:  # pragma: no cover
         return (json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None)).encode("utf-8")
 
 from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string
 
 # ---------- defaults ----------
 THIS = Path(__file__).resolve()
@@ -49,12 +50,17 @@ def ensure_parent(p: Path) -> None:
 
 def _excel_col_to_idx(label: str) -> int:
     """A→0, B→1, ...; ignores non-letters; returns 0-based index."""
-    s = re.sub(r"[^A-Za-z]", "", str(label)).upper()
+    s = str(label).strip()
+    if not (s.isascii() and s.isalpha()):
+        s = re.sub(r"[^A-Za-z]", "", s)
     if not s: return 0
-    n = 0
-    for ch in s:
-        n = n * 26 + (ord(ch) - ord("A") + 1)
-    return n - 1
+    try:
+        return column_index_from_string(s.upper()) - 1
+    except ValueError:  # past ZZZ: plain base-26, left for the caller to bound
+        n = 0
+        for ch in s.upper():
+            n = n * 26 + (ord(ch) - 64)
+        return n - 1
 
 # DK role suffixes like "(CPT)", "- CPT", "(Flex)" → strip
 _DK_ROLE_TOKENS_RE = re.compile(
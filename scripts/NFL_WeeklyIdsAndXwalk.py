@@ -14,12 +14,14 @@ Usage examples:
 from __future__ import annotations
 
 import argparse, json, re, sys, shutil, tempfile, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 import numpy as np
 from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string
 
 # ------------------------- defaults/paths -------------------------
 
@@ -58,43 +60,57 @@ def _stage_copy_for_read(src: Path) -> tuple[Path, Path]:
     """Copy workbook to temp so it can stay open in Excel while we read."""
     tmpdir = Path(tempfile.mkdtemp(prefix="nfl_weekly_"))
     dst = tmpdir / src.name
-    shutil.copy2(src, dst)
+    shutil.copyfile(src, dst)
     return dst, tmpdir
 
 # ------------------------ Excel display helpers -------------------
 
-_PERCENT_RE = re.compile(r"%")
+_PERCENT_RE  = re.compile(r"%")
+_DECIMALS_RE = re.compile(r"0\.([0]+)")
+
+@lru_cache(maxsize=256)
+def _fmt_meta(fmt: str) -> tuple[int, bool]:
+    """(decimals, is_percent) for a number format — a sheet only has a handful of distinct ones."""
+    m = _DECIMALS_RE.search(fmt)
+    return (len(m.group(1)) if m else 0), bool(_PERCENT_RE.search(fmt))
 
 def _decimals_from_format(fmt: str) -> int:
-    if not isinstance(fmt, str): return 0
-    m = re.search(r"0\.([0]+)", fmt)
-    return len(m.group(1)) if m else 0
+    if not isinstance(fmt, str):
+        return 0
+    return _fmt_meta(fmt)[0]
 
 def _format_cell(cell) -> str:
     v = cell.value
     if v is None:
         return ""
-    fmt = cell.number_format or ""
+
+    # exact-type checks first: plain str/float/int are nearly every cell
+    t = type(v)
+    if t is str:
+        return v.strip()
+    if t is float or t is int:
+        return _format_number(float(v), cell.number_format or "")
 
     # datetimes: let openpyxl give us python objects; stringify
     if isinstance(v, (datetime.date, datetime.datetime, datetime.time)):
         return str(v)
 
     if isinstance(v, (int, float, np.floating)):
-        x = float(v)
-        if _PERCENT_RE.search(fmt):
-            dec = _decimals_from_format(fmt)
-            n = x * 100.0 if abs(x) <= 1.01 else x
-            if float(n).is_integer():
-                return f"{int(round(n))}%"
-            return f"{n:.{dec}f}%"
-        if float(x).is_integer():
-            return str(int(round(x)))
-        dec = _decimals_from_format(fmt) or 1
-        return f"{x:.{dec}f}"
+        return _format_number(float(v), cell.number_format or "")
 
     return str(v).strip()
 
+def _format_number(x: float, number_format: str) -> str:
+    dec, is_pct = _fmt_meta(number_format)
+    if is_pct:
+        n = x * 100.0 if abs(x) <= 1.01 else x
+        if n.is_integer():
+            return f"{int(round(n))}%"
+        return f"{n:.{dec}f}%"
+    if x.is_integer():
+        return str(int(round(x)))
+    return f"{x:.{dec or 1}f}"
+
 # ------------------------ header normalization --------------------
 
 _HEADER_ALIASES = {
@@ -117,12 +133,11 @@ def _resolve_col(df: pd.DataFrame, name: str) -> Optional[str]:
 # ------------------------ literal table reader --------------------
 
 def _excel_col_to_idx(label: str) -> int:
-    s = re.sub(r"[^A-Za-z]", "", str(label)).upper()
+    s = str(label).strip()
+    if not (s.isascii() and s.isalpha()):
+        s = re.sub(r"[^A-Za-z]", "", s)
     if not s: return 0
-    n = 0
-    for ch in s:
-        n = n * 26 + (ord(ch) - ord("A") + 1)
-    return n - 1
+    return column_index_from_string(s.upper()) - 1  # ValueError past ZZZ
 
 def read_literal_table(xlsm_path: Path, sheet: str,
                        header_row: Optional[int],
@@ -143,14 +158,10 @@ def read_literal_table(xlsm_path: Path, sheet: str,
             except Exception: pass
 
         if header_row is None or data_start_row is None:
-            scan = min(8, ws.max_row)
-            best_r, best_nonempty = 1, -1
-            for r in range(1, scan + 1):
-                vals = [c.value for c in ws[r][0:max_c]]
-                nonempty = sum(1 for x in vals if x not in (None, ""))
-                if nonempty > best_nonempty:
-                    best_nonempty = nonempty
-                    best_r = r
+            # top rows in one values-only pull rather than one ws[r] parse each
+            head = ws.iter_rows(min_row=1, max_row=min(8, ws.max_row), max_col=max_c, values_only=True)
+            nonempty = [sum(1 for x in vals if x not in (None, "")) for vals in head]
+            best_r = 1 + max(range(len(nonempty)), key=nonempty.__getitem__) if nonempty else 1
             header_row = best_r
             data_start_row = best_r + 1
 
@@ -160,8 +171,8 @@ def read_literal_table(xlsm_path: Path, sheet: str,
 
         out_rows = []
         blanks_in_a_row = 0
-        for r in range(int(data_start_row), ws.max_row + 1):
-            cells = ws[r][0:max_c]
+        # stream the body once: each ws[r] on a read_only sheet re-parses from the top
+        for cells in ws.iter_rows(min_row=int(data_start_row), max_row=ws.max_row, max_col=max_c):
             row = [_format_cell(c) for c in cells]
             if all(v == "" for v in row):
                 blanks_in_a_row += 1
@@ -170,11 +181,10 @@ def read_literal_table(xlsm_path: Path, sheet: str,
             blanks_in_a_row = 0
             out_rows.append(row)
 
-        df = pd.DataFrame(out_rows, columns=headers)
-        df = df.dropna(how="all")
-        df = df.replace("", np.nan).dropna(how="all").fillna("")
-        df = df.loc[:, ~(df.astype(str).eq("").all())]
-        return df
+        # blank rows never reach out_rows, so only all-empty columns need dropping
+        arr = np.array(out_rows, dtype=object).reshape(len(out_rows), len(headers))
+        col_keep = (arr != "").any(axis=0)
+        return pd.DataFrame(arr[:, col_keep], columns=[h for h, k in zip(headers, col_keep) if k])
     finally:
         wb.close()
 
@@ -443,7 +453,7 @@ def main() -> None:
 
     staged_xlsm, temp_dir = _stage_copy_for_read(xlsm_path)
     try:
-        cfg = json.loads(config_path.read_text(encoding="utf-8-sig"))
+        cfg = json.loads(config_path.read_bytes())
 
         if not args.only_xwalk:
             print("\n=== SITE IDS ===")
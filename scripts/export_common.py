@@ -0,0 +1,96 @@
+"""
+Helpers shared by the MLB / NASCAR / NFL / NFL Showdown exporters.
+
+Imported as a sibling module: the exporters run as `python scripts/<name>.py`,
+which puts this directory on sys.path.
+"""
+
+from __future__ import annotations
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+
+# optional: orjson for the JSON writers (pandas' / stdlib encoders otherwise)
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def _floats_print_same(rows: List[list], cols: List[int]) -> bool:
+    """True when no float needs pandas' 10-decimal rounding (already short, modest magnitude)."""
+    for row in rows:
+        for j in cols:
+            v = row[j]
+            if type(v) is float and not (abs(v) < 1e6 and round(v, 9) == v):
+                return False
+    return True
+
+def to_json_records(df: pd.DataFrame) -> bytes:
+    """Records JSON (indent 2, NaN -> "") with the same values pandas' to_json writes."""
+    if len(df.columns) == 0:
+        return b"[]"  # pandas writes no per-row objects for a column-less frame
+    # orjson on plain records when it would print exactly what pandas does, else pandas
+    if orjson is not None and df.columns.is_unique:
+        arr = df.to_numpy(dtype=object)
+        na = pd.isna(arr)
+        if na.any():
+            arr = arr.copy()
+            arr[na] = ""
+        rows = arr.tolist()
+        if _floats_print_same(rows, [j for j, dt in enumerate(df.dtypes) if dt.kind in "fO"]):
+            cols = df.columns.tolist()
+            try:
+                return orjson.dumps([dict(zip(cols, row)) for row in rows],
+                                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME)
+            except TypeError:  # datetimes, numpy scalars, non-str keys
+                pass
+    df2 = df.astype(object).where(pd.notna(df), "")
+    return df2.to_json(orient="records", force_ascii=False, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=64)
+def filter_re(pattern: str, flags: int) -> re.Pattern:
+    """Compiled filter pattern; a config reuses a handful of them across many tasks."""
+    return re.compile(pattern, flags)
+
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+def str_contains(s: pd.Series, val: str) -> pd.Series:
+    # "contains" takes a regex, but a value with no metacharacters matches the
+    # same as a plain substring, which skips the regex engine
+    return s.str.contains(val, na=False, regex=not _REGEX_META.isdisjoint(val))
+
+
+def combine_masks(parts: List[pd.Series], index: pd.Index, how: str) -> pd.Series:
+    """AND/OR leaf masks in numpy — no wide DataFrame just to reduce it."""
+    if not parts:
+        return pd.Series([True] * len(index), index=index)
+    reduce = np.logical_or.reduce if how == "any" else np.logical_and.reduce
+    return pd.Series(reduce([p.to_numpy(dtype=bool) for p in parts]), index=index)
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """Write `obj` as indent-2 JSON to a sibling temp file, then os.replace it over `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # orjson when available, else stream into a 1 MiB buffer; either way next to the
+    # target, then swap it in so the site never reads a half-written file
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        try:
+            if orjson is None:
+                raise TypeError
+            tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        except TypeError:  # no orjson, or a value only the stdlib encoder takes (orjson's error is a TypeError)
+            with tmp.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+                json.dump(obj, fh, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
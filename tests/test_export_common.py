@@ -0,0 +1,47 @@
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import export_common  # noqa: E402
+
+
+def test_to_json_records_zero_columns_is_empty_list():
+    df = pd.DataFrame(index=range(3))
+    assert export_common.to_json_records(df) == b"[]"
+
+
+def test_to_json_records_matches_pandas_values():
+    df = pd.DataFrame({"Player": ["A", None], "Proj": [8.1, np.nan], "Sal": [9000, 8500]})
+    expected = df.astype(object).where(pd.notna(df), "").to_json(orient="records", force_ascii=False)
+    assert json.loads(export_common.to_json_records(df)) == json.loads(expected)
+
+
+def test_write_json_replaces_target_and_leaves_no_temp(tmp_path):
+    out = tmp_path / "nested" / "games.json"
+    export_common.write_json(out, [{"game": "BUF@KC", "total": 47.5}])
+    export_common.write_json(out, {"tables": []})
+    assert json.loads(out.read_bytes()) == {"tables": []}
+    assert [p.name for p in out.parent.iterdir()] == ["games.json"]
+
+
+def test_str_contains_literal_and_regex():
+    s = pd.Series(["KC (Home)", "BUF", None])
+    assert export_common.str_contains(s, "KC").tolist() == [True, False, False]
+    assert export_common.str_contains(s, "^B").tolist() == [False, True, False]
+
+
+def test_combine_masks_any_all_and_empty():
+    idx = pd.Index([3, 5, 7])
+    a = pd.Series([True, False, True], index=idx)
+    b = pd.Series([True, True, False], index=idx)
+    assert export_common.combine_masks([a, b], idx, "all").tolist() == [True, False, False]
+    assert export_common.combine_masks([a, b], idx, "any").tolist() == [True, True, True]
+    assert export_common.combine_masks([], idx, "all").index.equals(idx)
+
+
+def test_filter_re_reuses_compiled_pattern():
+    assert export_common.filter_re("^QB", 0) is export_common.filter_re("^QB", 0)
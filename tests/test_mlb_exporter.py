@@ -0,0 +1,84 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import MLB_Exporter as mlb  # noqa: E402
+
+SECTIONS = {
+    "C": [{"Player": "Catcher A", "Team": "NYY", "Proj": "8.1"},
+          {"Player": "Catcher B", "Team": "BOS", "Proj": "7.4"}],
+    "OF": [{"Player": "José Ramírez", "Team": "CLE", "Proj": "10.2"}],
+    "Empty": [],
+}
+
+
+@pytest.fixture
+def compact(request):
+    mlb._set_json_compact(request.param)
+    yield request.param
+    mlb._set_json_compact(False)
+
+
+@pytest.mark.parametrize("compact", [False], indirect=True)
+def test_write_json_sections_matches_json_dumps_indent(tmp_path, compact):
+    out = tmp_path / "cheat_sheet.json"
+    mlb._write_json_sections(out, SECTIONS)
+    assert out.read_bytes() == json.dumps(SECTIONS, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@pytest.mark.parametrize("compact", [True], indirect=True)
+def test_write_json_sections_compact(tmp_path, compact):
+    out = tmp_path / "cheat_sheet.json"
+    mlb._write_json_sections(out, SECTIONS)
+    assert out.read_bytes() == json.dumps(SECTIONS, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def test_write_json_sections_empty(tmp_path):
+    out = tmp_path / "cheat_sheet.json"
+    mlb._write_json_sections(out, {})
+    assert out.read_bytes() == b"{}"
+
+
+def test_run_task_duplicate_mapping_is_reported(tmp_path):
+    from openpyxl import Workbook
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Hitters"
+    ws.append(["Player", "Team", "Proj"])
+    ws.append(["Catcher A", "NYY", 8.1])
+    xlsx = tmp_path / "model.xlsx"
+    wb.save(xlsx)
+    task = {"sheet": "Hitters", "out_rel": "data/mlb/hitters", "format": "json",
+            "header_row": 1, "data_start_row": 2, "column_mapping": {"Team": "Player"}}
+    with pytest.raises(ValueError):
+        mlb.run_task(xlsx, tmp_path, task)
+    assert not (tmp_path / "public" / "data" / "mlb" / "hitters.json").exists()
+
+
+def test_to_json_records_rejects_duplicate_columns():
+    import pandas as pd
+    df = pd.DataFrame([["Catcher A", "NYY"]], columns=["Player", "Player"])
+    with pytest.raises(ValueError):
+        mlb.to_json_records(df)
+
+
+def test_task_is_fresh_needs_gzip_sidecar(tmp_path):
+    out = tmp_path / "public" / "data" / "mlb" / "hitters.json"
+    out.parent.mkdir(parents=True)
+    out.write_bytes(b"[]")
+    task = {"sheet": "Hitters", "out_rel": "data/mlb/hitters", "format": "json"}
+    assert mlb._task_is_fresh(tmp_path, task, 0)
+    assert not mlb._task_is_fresh(tmp_path, {**task, "gzip": True}, 0)
+    out.with_name("hitters.json.gz").write_bytes(b"")
+    assert mlb._task_is_fresh(tmp_path, {**task, "gzip": True}, 0)
+
+
+def test_output_flags_changed(tmp_path):
+    flags = {"compact_json": False, "fast_csv": False}
+    assert mlb._output_flags_changed(tmp_path, flags)
+    mlb._save_output_flags(tmp_path, flags)
+    assert not mlb._output_flags_changed(tmp_path, flags)
+    assert mlb._output_flags_changed(tmp_path, {**flags, "compact_json": True})
@@ -0,0 +1,47 @@
+import re
+import sys
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+import NASCAR_Exporter as nascar  # noqa: E402
+
+
+def _stale_dimension_book(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Cheat Sheet"
+    for r in range(1, 11):
+        ws.append([f"Driver {r}", r, r * 1.5, "NA" if r == 5 else "x"])
+    tmp = path.with_suffix(".tmp.xlsx")
+    wb.save(tmp)
+    # rewrite the sheet's <dimension> tag so it understates the used range
+    with zipfile.ZipFile(tmp) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:B2"', data)
+            dst.writestr(item, data)
+    tmp.unlink()
+
+
+def test_matrix_ignores_stale_dimension_tag(tmp_path):
+    path = tmp_path / "stale.xlsx"
+    _stale_dimension_book(path)
+    expected = pd.read_excel(path, sheet_name="Cheat Sheet", header=None, dtype=object).to_numpy(dtype=object)
+    with nascar.WorkbookCache(path) as wb:
+        got = wb.matrix("Cheat Sheet")
+    assert got.shape == expected.shape == (10, 4)
+    na = pd.isna(expected)
+    assert np.array_equal(pd.isna(got), na)
+    assert got[~na].tolist() == expected[~na].tolist()
+
+
+def test_clean_number_column_reads_dates_as_missing():
+    s = pd.Series(pd.to_datetime(["2024-01-01", "2024-03-04"]))
+    assert nascar._clean_number_column(s, nascar._clean_h2h_number, scale_fractions=True).isna().all()
+    assert nascar._clean_number_column(s, nascar._clean_percent_cell).isna().all()